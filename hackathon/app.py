@@ -1,27 +1,38 @@
+import functools
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# Copy-on-write defers defensive copies until a frame is actually mutated, so
+# read-only slices handed between core helpers stay zero-copy.
+pd.options.mode.copy_on_write = True
+
 st.set_page_config(
     page_title="Colorado Workforce Intelligence",
     page_icon="🏔️",
     layout="wide",
 )
 
-from hackathon.core.data import load_data, load_raw_skill_records
+from hackathon.core.data import load_data, load_raw_skill_records, prepare_raw_data
 from hackathon.core.analytics_logger import (
     analytics_artifact_paths,
     initialize_analytics_logger,
-    load_analytics_events,
+    load_analytics_partitions,
     log_analytics_event,
+    log_analytics_events,
 )
 from hackathon.core.intelligence import (
     analyze_ghost_job_language,
@@ -29,44 +40,158 @@ from hackathon.core.intelligence import (
     detect_credential_inflation,
     detect_emerging_skills,
     format_salary,
+    format_salary_vec,
     score_description,
 )
-from hackathon.core.matching import build_matching_index, compute_skill_gap, find_matching_jobs
+from hackathon.core.matching import (
+    build_job_skill_rankings,
+    build_matching_index,
+    compute_skill_gaps,
+    find_matching_jobs,
+)
 from hackathon.core.student import FIELD_KEYWORDS, top_field_skills, top_skills
-from hackathon.core.veterans import MOC_DICTIONARY, veteran_full_match
+from hackathon.core.veterans import MOC_DICTIONARY, find_direct_moc_matches
 
 
-@st.cache_data
-def load_cached_data():
-    return load_data()
+_DERIVED_JOBS_CACHE = PROJECT_ROOT / "data" / "processed" / "jobs_clean_derived.parquet"
+_RAW_JOBS_CSV = PROJECT_ROOT / "data" / "raw" / "colorado.csv"
+
+_TRUTHY_FLAGS = ["true", "1", "yes", "t"]
+
+MOC_PREVIEW = tuple(MOC_DICTIONARY.items())[:8]
+MOC_KEYS = frozenset(MOC_DICTIONARY)
+
+# Flag columns must stay plain np.bool_: nullable boolean dtype routes every
+# mask through the masked-array path and is drastically slower to filter on.
+_FLAG_COLUMNS = ("is_ghost", "is_federal", "has_apprenticeship", "has_moc", "has_cip")
+
+# Low-cardinality string columns that back the app's equality filters; as
+# category dtype those filters compare integer codes instead of strings.
+_CATEGORICAL_COLUMNS = (
+    "city",
+    "application_company",
+    "naics_sector",
+    "parameters_salary_unit",
+    "education_source",
+    "experience_source",
+)
+
+
+def _as_arrow_strings(frame: pd.DataFrame) -> pd.DataFrame:
+    """Back object string columns with Arrow so .str ops use vectorized kernels."""
+    string_columns = frame.columns[frame.dtypes == object]
+    if len(string_columns):
+        frame = frame.astype({column: "string[pyarrow]" for column in string_columns})
+    return frame
+
+
+def _with_derived_columns(jobs_clean: pd.DataFrame) -> pd.DataFrame:
+    if (
+        _DERIVED_JOBS_CACHE.exists()
+        and _RAW_JOBS_CSV.exists()
+        and _DERIVED_JOBS_CACHE.stat().st_mtime >= _RAW_JOBS_CSV.stat().st_mtime
+    ):
+        cached = pd.read_parquet(_DERIVED_JOBS_CACHE)
+        for flag_column in _FLAG_COLUMNS:
+            if cached[flag_column].dtype != np.bool_:
+                cached[flag_column] = cached[flag_column].fillna(False).astype(bool)
+        return cached
+
+    ghost_flag = jobs_clean["ghostjob"].astype("string[pyarrow]").str.lower()
+    federal_flag = jobs_clean["fedcontractor"].astype("string[pyarrow]").str.lower()
+    jobs_clean["is_ghost"] = ghost_flag.isin(_TRUTHY_FLAGS).fillna(False).astype(bool)
+    jobs_clean["is_federal"] = federal_flag.isin(_TRUTHY_FLAGS).fillna(False).astype(bool)
+    for flag_column, code_column in [
+        ("has_apprenticeship", "rapids_codes"),
+        ("has_moc", "moc_codes"),
+        ("has_cip", "cip_codes"),
+    ]:
+        codes = jobs_clean[code_column].astype("string[pyarrow]").str.strip()
+        jobs_clean[flag_column] = (codes.str.len() > 3).fillna(False).astype(bool)
+    jobs_clean["salary_min"] = pd.to_numeric(jobs_clean["parameters_salary_min"], errors="coerce").fillna(0)
+    jobs_clean["salary_max"] = pd.to_numeric(jobs_clean["parameters_salary_max"], errors="coerce").fillna(0)
+    jobs_clean["naics_sector"] = jobs_clean["classifications_naics_code"].astype(str).str[:2]
+
+    _DERIVED_JOBS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    jobs_clean.to_parquet(_DERIVED_JOBS_CACHE, index=False)
+    return jobs_clean
+
+
+@st.cache_data(
+    persist="disk",
+    show_spinner="Loading Colorado jobs…",
+    hash_funcs={Path: lambda path: (str(path), path.stat().st_mtime_ns)},
+)
+def load_cached_data(jobs_csv: Path, processed_csv: Path):
+    jobs_clean, skill_profiles, processed = load_data()
+    jobs_clean = _as_arrow_strings(_with_derived_columns(jobs_clean))
+    for column in _CATEGORICAL_COLUMNS:
+        if column in jobs_clean.columns:
+            jobs_clean[column] = jobs_clean[column].astype("category")
+    return jobs_clean, skill_profiles, processed
 
 
 @st.cache_data
 def load_cached_raw_processed():
-    return load_raw_skill_records()
+    processed_raw = _as_arrow_strings(load_raw_skill_records())
+    if "Taxonomy Source" in processed_raw.columns:
+        source = processed_raw["Taxonomy Source"].astype("string[pyarrow]").str.upper()
+        processed_raw["_is_esco"] = (
+            source.str.contains("ESCO", regex=False).fillna(False).astype(bool)
+        )
+        processed_raw["_is_onet"] = (
+            (
+                source.str.contains("ONET", regex=False)
+                | source.str.contains("O.NET", regex=False)
+                | source.str.contains("O*NET", regex=False)
+            )
+            .fillna(False)
+            .astype(bool)
+        )
+    return processed_raw
 
 
-jobs_clean, skill_profiles, processed = load_cached_data()
+jobs_clean, skill_profiles, processed = load_cached_data(*prepare_raw_data())
 processed_raw = load_cached_raw_processed()
 
-jobs_clean["is_ghost"] = jobs_clean.get("ghostjob", "").astype(str).str.lower().isin(["true", "1", "yes", "t"])
-jobs_clean["is_federal"] = jobs_clean.get("fedcontractor", "").astype(str).str.lower().isin(["true", "1", "yes", "t"])
-jobs_clean["has_apprenticeship"] = jobs_clean.get("rapids_codes", "").astype(str).str.strip().str.len() > 3
-jobs_clean["has_moc"] = jobs_clean.get("moc_codes", "").astype(str).str.strip().str.len() > 3
-jobs_clean["has_cip"] = jobs_clean.get("cip_codes", "").astype(str).str.strip().str.len() > 3
-jobs_clean["salary_min"] = pd.to_numeric(jobs_clean.get("parameters_salary_min", 0), errors="coerce").fillna(0)
-jobs_clean["salary_max"] = pd.to_numeric(jobs_clean.get("parameters_salary_max", 0), errors="coerce").fillna(0)
-jobs_clean["naics_sector"] = jobs_clean.get("classifications_naics_code", "").astype(str).str[:2]
+
+def _frame_token(frame: pd.DataFrame, column: str) -> str:
+    """Stable content key for the derived-data caches.
+
+    load_cached_data returns a fresh unpickled copy every rerun, so id()
+    changes each script run and would defeat any cache keyed on it; this is
+    the same row-count-plus-hash fingerprint data.py uses.
+    """
+    return f"{len(frame)}:{int(pd.util.hash_pandas_object(frame[column], index=False).sum())}"
+
+
+JOBS_TOKEN = _frame_token(jobs_clean, "system_job_id")
+PROCESSED_TOKEN = _frame_token(processed, "Research ID")
 
 
 @st.cache_resource
 def load_matching_index(skill_profiles_frame: pd.DataFrame):
-    return build_matching_index(skill_profiles_frame)
+    return build_matching_index(
+        skill_profiles_frame, cache_dir=PROJECT_ROOT / "data" / "processed"
+    )
+
+
+@st.cache_resource
+def load_jobs_indexed(jobs_frame: pd.DataFrame):
+    return jobs_frame.set_index("system_job_id", drop=False)
+
+
+@st.cache_resource
+def load_job_skill_rankings(skill_mentions_frame: pd.DataFrame):
+    return build_job_skill_rankings(skill_mentions_frame)
 
 
 matching_index = load_matching_index(skill_profiles)
+jobs_indexed = load_jobs_indexed(jobs_clean)
+job_skill_rankings = load_job_skill_rankings(processed)
 
 
+@functools.lru_cache(maxsize=4096)
 def _format_salary_range(salary_min, salary_max) -> str:
     if not str(salary_min).strip() or not str(salary_max).strip():
         return "Not listed"
@@ -76,12 +201,124 @@ def _format_salary_range(salary_min, salary_max) -> str:
         return "Not listed"
 
 
-def _demand_tier_by_rank(rank: int) -> str:
-    if rank <= 6:
-        return "High"
-    if rank <= 14:
-        return "Medium"
-    return "Low"
+def _mask_take(frame: pd.DataFrame, mask) -> pd.DataFrame:
+    """Row-filter via positional take; selects hit rows without per-column masking."""
+    return frame.take(np.flatnonzero(np.asarray(mask)))
+
+
+def _dollar_col(series: pd.Series) -> pd.Series:
+    """Vectorized '$12,345' / 'Not listed' formatting for salary columns."""
+    values = pd.to_numeric(series, errors="coerce").fillna(0).to_numpy(dtype=float)
+    formatted = np.array([f"${value:,.0f}" for value in values], dtype=object)
+    return pd.Series(np.where(values > 0, formatted, "Not listed"), index=series.index)
+
+
+def _pct_col(series: pd.Series) -> pd.Series:
+    """Vectorized whole-percent formatting for score columns."""
+    return (pd.to_numeric(series, errors="coerce").fillna(0) * 100).round(0).astype(int).astype(str) + "%"
+
+
+def _requirement_labels(display: pd.Series, source: pd.Series) -> pd.Series:
+    """Vectorized '<value> (<status>, source: <label>)' strings for result cards."""
+    display_value = display.astype(str).replace("", "Not specified")
+    source_value = source.astype(str)
+    status = np.where(source_value != "not_specified", "Specified", "Not specified")
+    source_label = np.select(
+        [source_value == "dataset", source_value == "nlp_inferred"],
+        ["Dataset", "NLP inferred"],
+        default="None",
+    )
+    return display_value + " (" + status + ", source: " + source_label + ")"
+
+
+@st.cache_data
+def _top_skills_block(dataset_key: str) -> tuple[pd.Series, pd.DataFrame, int]:
+    skill_counts = top_skills(processed, limit=20)
+    skill_df = skill_counts.reset_index()
+    skill_df.columns = ["Skill", "Mentions"]
+    skill_df["Rank"] = np.arange(1, len(skill_df) + 1)
+    skill_df["Demand Tier"] = np.where(
+        skill_df["Rank"] <= 6, "High", np.where(skill_df["Rank"] <= 14, "Medium", "Low")
+    )
+    total_mentions = int(skill_df["Mentions"].sum()) if not skill_df.empty else 0
+    return skill_counts, skill_df, total_mentions
+
+
+@st.cache_data(show_spinner=False, max_entries=128, ttl="1h")
+def _cached_matches(normalized_query: str, top_n: int) -> pd.DataFrame:
+    return find_matching_jobs(
+        normalized_query,
+        jobs_clean,
+        skill_profiles,
+        top_n=top_n,
+        matching_index=matching_index,
+        jobs_indexed=jobs_indexed,
+    )
+
+
+def _search_jobs(query: str, top_n: int) -> pd.DataFrame:
+    """Memoized corpus search; the corpus is fixed, so key on the query alone."""
+    return _cached_matches(str(query).strip().lower(), top_n)
+
+
+@st.cache_resource(show_spinner=False)
+def _search_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="job-search")
+
+
+def _submit_search(query: str, top_n: int) -> Future:
+    """Run the TF-IDF search off the script thread so reruns stay responsive."""
+    script_ctx = get_script_run_ctx()
+
+    def _run() -> pd.DataFrame:
+        add_script_run_ctx(threading.current_thread(), script_ctx)
+        return _search_jobs(query, top_n)
+
+    return _search_executor().submit(_run)
+
+
+def _analytics_log_token(sqlite_path: Path) -> tuple:
+    """Change token for the analytics DB: main file plus the WAL sidecar.
+
+    Under WAL journaling, inserts only touch the -wal file until a
+    checkpoint, so the main file's mtime alone misses new events.
+    """
+    token = []
+    for path in (sqlite_path, sqlite_path.with_name(sqlite_path.name + "-wal")):
+        try:
+            stat = path.stat()
+            token.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            token.append(None)
+    return tuple(token)
+
+
+@st.cache_resource
+def _analytics_partitions(log_token: tuple) -> dict[str, pd.DataFrame]:
+    """Typed event partitions, re-read only when the SQLite log changes."""
+    return load_analytics_partitions(PROJECT_ROOT)
+
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def _credential_inflation(dataset_key: str) -> pd.DataFrame:
+    return detect_credential_inflation(jobs_clean)
+
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def _salary_by_city(dataset_key: str) -> pd.DataFrame:
+    return build_salary_by_city(jobs_clean)
+
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def _ghost_language_analysis(dataset_key: str):
+    return analyze_ghost_job_language(jobs_clean)
+
+
+@st.cache_data(show_spinner=False)
+def _field_insights(field: str) -> tuple[pd.DataFrame, pd.Series]:
+    results = _search_jobs(FIELD_KEYWORDS[field], top_n=8)
+    field_skill_counts = top_field_skills(processed, results["system_job_id"].tolist(), limit=10)
+    return results, field_skill_counts
 
 
 def _style_demand_tier_row(row: pd.Series) -> list[str]:
@@ -122,32 +359,31 @@ def _init_analytics_state() -> None:
         )
 
 
-def _log_recommendations(results: pd.DataFrame, channel: str, top_n: int = 5) -> None:
+def _log_recommendations(
+    results: pd.DataFrame,
+    channel: str,
+    top_n: int = 5,
+    timestamp: str | None = None,
+) -> None:
     if results.empty:
         return
 
-    timestamp = datetime.now().isoformat()
-    for _, row in results.head(top_n).iterrows():
-        st.session_state.recommendation_events.append(
-            {
-                "timestamp": timestamp,
-                "channel": channel,
-                "title": str(row.get("title", "Untitled")),
-                "city": str(row.get("city", "Unknown City")),
-                "match_score": float(row.get("match_score", 0) or 0),
-            }
-        )
-        log_analytics_event(
-            PROJECT_ROOT,
-            {
-                "timestamp": timestamp,
-                "event_type": "recommendation",
-                "channel": channel,
-                "title": str(row.get("title", "Untitled")),
-                "city": str(row.get("city", "Unknown City")),
-                "match_score": float(row.get("match_score", 0) or 0),
-            },
-        )
+    timestamp = timestamp or datetime.now().isoformat()
+    top_records = results.head(top_n)[["title", "city", "match_score"]].to_dict(orient="records")
+    events = [
+        {
+            "timestamp": timestamp,
+            "channel": channel,
+            "title": str(record.get("title", "Untitled")),
+            "city": str(record.get("city", "Unknown City")),
+            "match_score": float(record.get("match_score", 0) or 0),
+        }
+        for record in top_records
+    ]
+    st.session_state.recommendation_events.extend(events)
+    log_analytics_events(
+        PROJECT_ROOT, [{**event, "event_type": "recommendation"} for event in events]
+    )
 
 
 _init_analytics_state()
@@ -163,97 +399,12 @@ FIELD_DESCRIPTIONS = {
 }
 
 
-st.markdown(
-    """
-<style>
-    .stApp {
-        background:
-            radial-gradient(circle at 15% 12%, rgba(56, 189, 248, 0.16), transparent 34%),
-            radial-gradient(circle at 82% 18%, rgba(14, 165, 233, 0.12), transparent 30%),
-            linear-gradient(135deg, #0b1220 0%, #111827 42%, #0f172a 100%);
-        background-attachment: fixed;
-    }
-    .stApp::before {
-        content: "";
-        position: fixed;
-        inset: 0;
-        pointer-events: none;
-        background:
-            repeating-linear-gradient(
-                90deg,
-                rgba(148, 163, 184, 0.06) 0px,
-                rgba(148, 163, 184, 0.06) 1px,
-                transparent 1px,
-                transparent 68px
-            ),
-            repeating-linear-gradient(
-                0deg,
-                rgba(148, 163, 184, 0.05) 0px,
-                rgba(148, 163, 184, 0.05) 1px,
-                transparent 1px,
-                transparent 68px
-            );
-        opacity: 0.18;
-        z-index: 0;
-    }
-    .block-container {
-        position: relative;
-        z-index: 1;
-        padding-top: 1.3rem;
-        padding-bottom: 2rem;
-        max-width: 1160px;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.35rem;
-    }
-    .stTabs [data-baseweb="tab"] {
-        font-weight: 600;
-        border-radius: 8px;
-        padding: 0.45rem 0.8rem;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: rgba(31, 41, 55, 0.08);
-    }
-    .hero-wrap {
-        background: rgba(15, 23, 42, 0.68);
-        border: 1px solid rgba(56, 189, 248, 0.28);
-        border-radius: 10px;
-        padding: 0.95rem 1rem;
-        margin-bottom: 1rem;
-        backdrop-filter: blur(4px);
-    }
-    .result-card {
-        border: 1px solid rgba(71, 85, 105, 0.6);
-        border-radius: 10px;
-        padding: 0.7rem 0.85rem;
-        margin-bottom: 0.55rem;
-        background: rgba(15, 23, 42, 0.48);
-    }
-    .skill-card {
-        border: 1px solid rgba(71, 85, 105, 0.6);
-        border-radius: 10px;
-        padding: 0.65rem 0.8rem;
-        margin-bottom: 0.45rem;
-        background: rgba(15, 23, 42, 0.52);
-    }
-    .section-kicker {
-        font-size: 0.78rem;
-        font-weight: 700;
-        letter-spacing: 0.06em;
-        color: rgba(125, 211, 252, 0.95);
-        text-transform: uppercase;
-        margin-bottom: 0.15rem;
-    }
-    .subtle {
-        color: rgba(226, 232, 240, 0.9);
-        font-size: 0.92rem;
-        margin-top: 0;
-        margin-bottom: 0;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+@st.cache_resource
+def _page_css() -> str:
+    return Path(__file__).with_name("app.css").read_text(encoding="utf-8")
+
+
+st.html(f"<style>{_page_css()}</style>")
 
 st.title("Colorado Workforce Intelligence")
 st.caption("Powered by NLx data with NLP-extracted skill intelligence")
@@ -267,11 +418,32 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+@st.cache_data
+def _city_options(dataset_key: str) -> list[str]:
+    cities = jobs_clean["city"].cat.categories.astype(str).str.strip()
+    return ["All Cities"] + sorted(cities[cities != ""].unique().tolist())
+
+
+@st.cache_data
+def _overview_counts(dataset_key: str) -> tuple[int, int]:
+    cities = jobs_clean["city"].astype("string[pyarrow]").str.strip()
+    employers = jobs_clean["application_company"].astype("string[pyarrow]").str.strip()
+    return int(cities[cities != ""].nunique()), int(employers[employers != ""].nunique())
+
+
+@st.cache_data
+def _static_metrics(dataset_key: str) -> dict[str, int]:
+    return {
+        "ghost_count": int(jobs_clean["is_ghost"].sum()),
+        "federal_count": int(jobs_clean["is_federal"].sum()),
+        "apprenticeship_count": int(jobs_clean["has_apprenticeship"].sum()),
+    }
+
+
 overview_col1, overview_col2, overview_col3, overview_col4 = st.columns(4)
-city_count = jobs_clean["city"].astype(str).str.strip()
-city_count = city_count[city_count != ""].nunique()
-employer_count = jobs_clean["application_company"].astype(str).str.strip()
-employer_count = employer_count[employer_count != ""].nunique()
+city_count, employer_count = _overview_counts(JOBS_TOKEN)
+static_metrics = _static_metrics(JOBS_TOKEN)
+city_options = _city_options(JOBS_TOKEN)
 overview_col1.metric("Jobs Indexed", f"{len(jobs_clean):,}")
 overview_col2.metric("Cities Covered", f"{city_count:,}")
 overview_col3.metric("Skill Profiles", f"{len(skill_profiles):,}")
@@ -305,7 +477,6 @@ with tab1:
             height=130,
         )
     with filter_col:
-        city_options = ["All Cities"] + sorted([city for city in jobs_clean["city"].unique() if str(city).strip()])
         city_filter = st.selectbox("Filter by city", city_options)
         num_results = st.slider("Number of results", min_value=5, max_value=20, value=10, step=1)
         hide_ghosts = st.checkbox("Hide ghost jobs", value=True)
@@ -317,29 +488,40 @@ with tab1:
         if not user_skills.strip():
             st.warning("Please describe your skills first.")
         else:
-            with st.spinner("Matching your skills to Colorado jobs..."):
-                results = find_matching_jobs(
-                    user_skills,
-                    jobs_clean,
-                    skill_profiles,
-                    top_n=min(num_results * 4, 80),
-                    matching_index=matching_index,
-                )
-
-                if city_filter != "All Cities":
-                    results = results[results["city"] == city_filter]
-                if hide_ghosts:
-                    results = results[~results["is_ghost"]]
-                if federal_only:
-                    results = results[results["is_federal"]]
-                if apprenticeship_only:
-                    results = results[results["has_apprenticeship"]]
-
-                results = results.head(num_results)
+            st.session_state.search_future = _submit_search(
+                user_skills, top_n=min(num_results * 4, 80)
+            )
 
+    search_future = st.session_state.get("search_future")
+    if search_future is not None:
+        if not search_future.done():
+            # Keep the script thread free for filter changes while the worker
+            # runs; each poll rerun is cheap because everything above is cached.
+            st.caption("Matching your skills to Colorado jobs...")
+            time.sleep(0.15)
+            st.rerun()
+        else:
+            del st.session_state["search_future"]
+            results = search_future.result()
+
+            predicates = []
+            if city_filter != "All Cities":
+                predicates.append("city == @city_filter")
+            if hide_ghosts:
+                predicates.append("not is_ghost")
+            if federal_only:
+                predicates.append("is_federal")
+            if apprenticeship_only:
+                predicates.append("has_apprenticeship")
+            if predicates:
+                results = results.query(" and ".join(predicates))
+
+            results = results.head(num_results)
+
+            event_ts = datetime.now().isoformat()
             st.session_state.job_search_events.append(
                 {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": event_ts,
                     "city_filter": city_filter,
                     "results_count": int(len(results)),
                 }
@@ -347,79 +529,69 @@ with tab1:
             log_analytics_event(
                 PROJECT_ROOT,
                 {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": event_ts,
                     "event_type": "search",
                     "channel": "job_seeker",
                     "city_filter": city_filter,
                     "results_count": int(len(results)),
                 },
             )
-            _log_recommendations(results, channel="job_seeker", top_n=5)
+            _log_recommendations(results, channel="job_seeker", top_n=5, timestamp=event_ts)
 
             st.success(f"Found {len(results)} matching jobs")
 
             if results.empty:
                 st.info("No matches found for the selected filters. Try broader skills or remove city filtering.")
             elif hide_ghosts:
-                ghost_count = int(jobs_clean["is_ghost"].sum())
+                ghost_count = static_metrics["ghost_count"]
                 st.caption(f"Ghost-job filter is active. {ghost_count:,} flagged postings were excluded.")
 
-            for _, row in results.iterrows():
-                title = row.get("title", "Untitled Role")
-                company = row.get("application_company", "Unknown Company")
-                city = row.get("city", "Unknown City")
-                score = row.get("match_score", 0)
-                score_label = "Strong" if float(score) >= 0.50 else "Moderate" if float(score) >= 0.30 else "Partial"
-                badge_parts = [f"{float(score):.0%} {score_label}"]
-                if row.get("is_ghost", False):
-                    badge_parts.append("Ghost")
-                if row.get("is_federal", False):
-                    badge_parts.append("Federal")
-                if row.get("has_apprenticeship", False):
-                    badge_parts.append("Apprenticeship")
-
-                with st.expander(f"{title} · {company} · {city} · {' | '.join(badge_parts)}"):
-                    score = row.get("match_score", 0)
+            scores = pd.to_numeric(results["match_score"], errors="coerce").fillna(0)
+            score_labels = np.select([scores >= 0.50, scores >= 0.30], ["Strong", "Moderate"], default="Partial")
+            results = results.assign(
+                score_value=scores,
+                badge_str=(scores * 100).round().astype(int).astype(str)
+                + "% "
+                + score_labels
+                + np.where(results["is_ghost"], " | Ghost", "")
+                + np.where(results["is_federal"], " | Federal", "")
+                + np.where(results["has_apprenticeship"], " | Apprenticeship", ""),
+                salary_display=[
+                    _format_salary_range(low, high)
+                    for low, high in zip(
+                        results["parameters_salary_min"], results["parameters_salary_max"]
+                    )
+                ],
+                education_label=_requirement_labels(
+                    results["education_display"], results["education_source"]
+                ),
+                experience_label=_requirement_labels(
+                    results["experience_display"], results["experience_source"]
+                ),
+            )
+
+            gap_map = compute_skill_gaps(
+                user_text=user_skills,
+                job_ids=results["system_job_id"].tolist(),
+                skill_mentions=processed,
+                limit=10,
+                skill_rankings=job_skill_rankings,
+            )
+
+            for row in results.itertuples(index=False):
+                title = row.title or "Untitled Role"
+                company = row.application_company or "Unknown Company"
+                city = row.city or "Unknown City"
+
+                with st.expander(f"{title} · {company} · {city} · {row.badge_str}"):
                     top_l, top_r, top_rr = st.columns([1, 1, 1])
-                    top_l.metric("Match Score", f"{float(score):.0%}")
+                    top_l.metric("Match Score", f"{row.score_value:.0%}")
                     top_r.metric("City", str(city) if str(city).strip() else "Unknown")
-                    top_rr.metric(
-                        "Salary",
-                        _format_salary_range(
-                            row.get("parameters_salary_min", ""),
-                            row.get("parameters_salary_max", ""),
-                        ),
-                    )
-                    education_value = row.get("education_display", "") or "Not specified"
-                    education_source = row.get("education_source", "not_specified")
-                    education_status = "Specified" if education_source != "not_specified" else "Not specified"
-                    education_source_label = (
-                        "Dataset"
-                        if education_source == "dataset"
-                        else "NLP inferred"
-                        if education_source == "nlp_inferred"
-                        else "None"
-                    )
-                    st.write(f"Education: {education_value} ({education_status}, source: {education_source_label})")
-
-                    experience_value = row.get("experience_display", "") or "Not specified"
-                    experience_source = row.get("experience_source", "not_specified")
-                    experience_status = "Specified" if experience_source != "not_specified" else "Not specified"
-                    experience_source_label = (
-                        "Dataset"
-                        if experience_source == "dataset"
-                        else "NLP inferred"
-                        if experience_source == "nlp_inferred"
-                        else "None"
-                    )
-                    st.write(f"Experience: {experience_value} ({experience_status}, source: {experience_source_label})")
+                    top_rr.metric("Salary", row.salary_display)
+                    st.write(f"Education: {row.education_label}")
+                    st.write(f"Experience: {row.experience_label}")
 
-                    matched_skills, missing_skills = compute_skill_gap(
-                        user_text=user_skills,
-                        job_id=row.get("system_job_id", ""),
-                        skill_mentions=processed,
-                        limit=10,
-                    )
+                    matched_skills, missing_skills = gap_map.get(str(row.system_job_id), ([], []))
 
                     gap_left, gap_right = st.columns(2)
                     with gap_left:
@@ -438,7 +610,7 @@ with tab1:
                         else:
                             st.write("• No major gaps detected in top skills")
 
-                    job_link = str(row.get("link", "")).strip()
+                    job_link = str(row.link).strip()
                     if job_link:
                         st.link_button("View Job Posting", job_link, use_container_width=True)
 
@@ -455,37 +627,22 @@ with tab1:
         if not adjacent_text.strip():
             st.warning("Please provide a short background description first.")
         else:
-            adjacent_results = find_matching_jobs(
-                adjacent_text,
-                jobs_clean,
-                skill_profiles,
-                top_n=30,
-                matching_index=matching_index,
-            )
+            adjacent_results = _search_jobs(adjacent_text, top_n=30)
             if adjacent_results.empty:
                 st.info("No adjacent career matches found right now.")
             else:
-                seen_sectors = set()
-                selected_rows = []
-                for _, adjacent_row in adjacent_results.iterrows():
-                    sector = str(adjacent_row.get("naics_sector", ""))
-                    if sector not in seen_sectors and len(selected_rows) < 8:
-                        seen_sectors.add(sector)
-                        selected_rows.append(adjacent_row)
+                top_adjacent = adjacent_results.drop_duplicates(subset="naics_sector", keep="first").head(8)
                 adjacent_display = pd.DataFrame(
                     {
-                        "Job Title": [r.get("title", "") for r in selected_rows],
-                        "Employer": [r.get("application_company", "") for r in selected_rows],
-                        "City": [r.get("city", "") for r in selected_rows],
-                        "Match": [f"{float(r.get('match_score', 0)):.0%}" for r in selected_rows],
-                        "Salary": [
-                            format_salary(
-                                r.get("salary_min", r.get("parameters_salary_min", "")),
-                                r.get("salary_max", r.get("parameters_salary_max", "")),
-                                r.get("parameters_salary_unit", ""),
-                            )
-                            for r in selected_rows
-                        ],
+                        "Job Title": top_adjacent["title"],
+                        "Employer": top_adjacent["application_company"],
+                        "City": top_adjacent["city"],
+                        "Match": _pct_col(top_adjacent["match_score"]),
+                        "Salary": format_salary_vec(
+                            top_adjacent["salary_min"],
+                            top_adjacent["salary_max"],
+                            top_adjacent["parameters_salary_unit"],
+                        ),
                     }
                 )
                 st.dataframe(adjacent_display, hide_index=True, use_container_width=True)
@@ -494,12 +651,7 @@ with tab2:
     st.header("What Skills Are Trending in Colorado?")
     st.caption("See the most demanded skills and explore likely roles by field.")
 
-    skill_counts = top_skills(processed, limit=20)
-    skill_df = skill_counts.reset_index()
-    skill_df.columns = ["Skill", "Mentions"]
-    skill_df["Rank"] = range(1, len(skill_df) + 1)
-    skill_df["Demand Tier"] = skill_df["Rank"].map(_demand_tier_by_rank)
-    total_mentions_top20 = int(skill_df["Mentions"].sum()) if not skill_df.empty else 0
+    skill_counts, skill_df, total_mentions_top20 = _top_skills_block(PROCESSED_TOKEN)
 
     metric_col1, metric_col2, metric_col3 = st.columns(3)
     if not skill_df.empty:
@@ -529,9 +681,9 @@ with tab2:
         if taxonomy_required.issubset(processed_raw.columns):
             source_left, source_right = st.columns(2)
             with source_left:
-                esco_series = processed_raw[
-                    processed_raw["Taxonomy Source"].astype(str).str.upper().str.contains("ESCO", na=False)
-                ]["Taxonomy Skill"].value_counts().head(15)
+                esco_series = (
+                    processed_raw.loc[processed_raw["_is_esco"], "Taxonomy Skill"].value_counts().head(15)
+                )
                 if len(esco_series) > 0:
                     esco_df = esco_series.reset_index()
                     esco_df.columns = ["Skill", "Count"]
@@ -540,9 +692,9 @@ with tab2:
                 else:
                     st.info("No ESCO-tagged taxonomy rows found.")
             with source_right:
-                onet_series = processed_raw[
-                    processed_raw["Taxonomy Source"].astype(str).str.upper().str.contains(r"ONET|O\\.NET", na=False, regex=True)
-                ]["Taxonomy Skill"].value_counts().head(15)
+                onet_series = (
+                    processed_raw.loc[processed_raw["_is_onet"], "Taxonomy Skill"].value_counts().head(15)
+                )
                 if len(onet_series) > 0:
                     onet_df = onet_series.reset_index()
                     onet_df.columns = ["Skill", "Count"]
@@ -581,20 +733,12 @@ with tab2:
 
     if run_field:
         with st.spinner("Analyzing this career field..."):
-            query = FIELD_KEYWORDS[field]
-            results = find_matching_jobs(
-                query,
-                jobs_clean,
-                skill_profiles,
-                top_n=8,
-                matching_index=matching_index,
-            )
-            field_job_ids = results["system_job_id"].tolist()
-            field_skill_counts = top_field_skills(processed, field_job_ids, limit=10)
+            results, field_skill_counts = _field_insights(field)
 
+        event_ts = datetime.now().isoformat()
         st.session_state.field_search_events.append(
             {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": event_ts,
                 "field": field,
                 "results_count": int(len(results)),
             }
@@ -602,14 +746,14 @@ with tab2:
         log_analytics_event(
             PROJECT_ROOT,
             {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": event_ts,
                 "event_type": "search",
                 "channel": "student_field",
                 "field": field,
                 "results_count": int(len(results)),
             },
         )
-        _log_recommendations(results, channel="student_field", top_n=5)
+        _log_recommendations(results, channel="student_field", top_n=5, timestamp=event_ts)
 
         st.success(f"Top roles and skills for {field}")
 
@@ -636,13 +780,13 @@ with tab2:
                 if view_mode == "Table View":
                     st.dataframe(skill_table, hide_index=True, use_container_width=True)
                 else:
-                    for _, skill_row in skill_table.iterrows():
+                    for rank, skill, demand_count in skill_table.itertuples(index=False, name=None):
                         st.markdown(
                             f"""
 <div class="skill-card">
-  <div class="section-kicker">Rank #{int(skill_row['Rank'])}</div>
-  <div><strong>{skill_row['Skill']}</strong></div>
-  <p class="subtle">Demand count: {int(skill_row['Demand Count']):,}</p>
+  <div class="section-kicker">Rank #{int(rank)}</div>
+  <div><strong>{skill}</strong></div>
+  <p class="subtle">Demand count: {int(demand_count):,}</p>
 </div>
 """,
                             unsafe_allow_html=True,
@@ -664,7 +808,7 @@ with tab2:
                         "match_score": "Match Score",
                     }
                 )
-                jobs_table["Match Score"] = jobs_table["Match Score"].fillna(0).map(lambda value: f"{float(value):.0%}")
+                jobs_table["Match Score"] = _pct_col(jobs_table["Match Score"])
                 if view_mode == "Table View":
                     st.dataframe(jobs_table, hide_index=True, use_container_width=True)
                 else:
@@ -728,8 +872,8 @@ with tab2:
     st.markdown("---")
     st.subheader("No-Degree Pathways")
     st.caption("Registered apprenticeship pathways from RAPIDS-linked postings in Colorado.")
-    apprenticeship_jobs = jobs_clean[jobs_clean["has_apprenticeship"]].copy()
-    apprenticeship_salary = apprenticeship_jobs[apprenticeship_jobs["salary_min"] > 0]["salary_min"]
+    apprenticeship_jobs = _mask_take(jobs_clean, jobs_clean["has_apprenticeship"]).copy()
+    apprenticeship_salary = _mask_take(apprenticeship_jobs, apprenticeship_jobs["salary_min"] > 0)["salary_min"]
 
     apprenticeship_metric_1, apprenticeship_metric_2 = st.columns(2)
     apprenticeship_metric_1.metric("Jobs With Apprenticeship Path", f"{len(apprenticeship_jobs):,}")
@@ -741,32 +885,17 @@ with tab2:
     if apprenticeship_jobs.empty:
         st.info("No apprenticeship-linked postings are available in the current dataset snapshot.")
     else:
-        apprenticeship_table = apprenticeship_jobs[
-            [
-                "title",
-                "city",
-                "application_company",
-                "salary_min",
-                "salary_max",
-                "requirements_min_education",
-                "rapids_codes",
-            ]
-        ].copy()
-        apprenticeship_table["salary_min"] = apprenticeship_table["salary_min"].apply(
-            lambda value: f"${value:,.0f}" if float(value) > 0 else "Not listed"
-        )
-        apprenticeship_table["salary_max"] = apprenticeship_table["salary_max"].apply(
-            lambda value: f"${value:,.0f}" if float(value) > 0 else "Not listed"
+        apprenticeship_table = pd.DataFrame(
+            {
+                "Job Title": apprenticeship_jobs["title"].to_numpy(),
+                "City": apprenticeship_jobs["city"].to_numpy(),
+                "Employer": apprenticeship_jobs["application_company"].to_numpy(),
+                "Min Salary": _dollar_col(apprenticeship_jobs["salary_min"]).to_numpy(),
+                "Max Salary": _dollar_col(apprenticeship_jobs["salary_max"]).to_numpy(),
+                "Education Required": apprenticeship_jobs["requirements_min_education"].to_numpy(),
+                "RAPIDS Code": apprenticeship_jobs["rapids_codes"].to_numpy(),
+            }
         )
-        apprenticeship_table.columns = [
-            "Job Title",
-            "City",
-            "Employer",
-            "Min Salary",
-            "Max Salary",
-            "Education Required",
-            "RAPIDS Code",
-        ]
         st.dataframe(apprenticeship_table, hide_index=True, use_container_width=True)
 
 with tab3:
@@ -785,7 +914,7 @@ with tab3:
         )
         veteran_federal_only = st.checkbox("Federal contractor jobs only", value=False, key="veteran_federal_only")
         st.markdown("**Common MOS/MOC Codes**")
-        for code, (role, _) in list(MOC_DICTIONARY.items())[:8]:
+        for code, (role, _) in MOC_PREVIEW:
             st.caption(f"{code} — {role}")
 
     with col2:
@@ -799,43 +928,34 @@ with tab3:
                     base_query = "operations leadership management team coordination"
 
                     if moc_input:
-                        direct_matches, skill_matches, moc_title = veteran_full_match(
-                            moc_input,
-                            jobs_clean,
-                            skill_profiles,
-                            top_n=30,
-                            matching_index=matching_index,
-                        )
-                        if moc_input in MOC_DICTIONARY:
-                            base_query = MOC_DICTIONARY[moc_input][1]
-                    else:
-                        skill_matches = find_matching_jobs(
-                            user_input=veteran_text,
-                            jobs_clean=jobs_clean,
-                            skill_profiles=skill_profiles,
-                            top_n=30,
-                            matching_index=matching_index,
-                        )
+                        direct_matches = find_direct_moc_matches(moc_input, jobs_clean)
+                        if moc_input in MOC_KEYS:
+                            moc_title, base_query = MOC_DICTIONARY[moc_input]
+                        elif direct_matches.empty and not veteran_text.strip():
+                            # Unknown code, no tagged postings, nothing to
+                            # search on: skip the matching pipeline entirely.
+                            st.warning(
+                                f"'{moc_input}' is not a recognized MOS/MOC code. "
+                                "Check the common codes list or describe your experience instead."
+                            )
+                            st.stop()
+                        else:
+                            moc_title = moc_input
 
-                    combined_query = " ".join([base_query, veteran_text]).strip()
-                    if combined_query:
-                        skill_matches = find_matching_jobs(
-                            user_input=combined_query,
-                            jobs_clean=jobs_clean,
-                            skill_profiles=skill_profiles,
-                            top_n=30,
-                            matching_index=matching_index,
-                        )
+                    combined_query = " ".join([base_query, veteran_text]).strip() or base_query
+                    skill_matches = _search_jobs(combined_query, top_n=30)
 
                     if veteran_federal_only:
-                        direct_matches = direct_matches[direct_matches["is_federal"]]
-                        skill_matches = skill_matches[skill_matches["is_federal"]]
+                        if not direct_matches.empty:
+                            direct_matches = _mask_take(direct_matches, direct_matches["is_federal"])
+                        skill_matches = _mask_take(skill_matches, skill_matches["is_federal"])
 
                     skill_matches = skill_matches.head(10)
 
+                event_ts = datetime.now().isoformat()
                 st.session_state.veteran_search_events.append(
                     {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": event_ts,
                         "moc": moc_input,
                         "direct_count": int(len(direct_matches)),
                         "skill_count": int(len(skill_matches)),
@@ -844,7 +964,7 @@ with tab3:
                 log_analytics_event(
                     PROJECT_ROOT,
                     {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": event_ts,
                         "event_type": "search",
                         "channel": "veteran",
                         "moc": moc_input,
@@ -853,31 +973,38 @@ with tab3:
                         "results_count": int(len(skill_matches)),
                     },
                 )
-                _log_recommendations(skill_matches, channel="veteran", top_n=5)
+                _log_recommendations(skill_matches, channel="veteran", top_n=5, timestamp=event_ts)
 
                 results_label = f"{moc_input} — {moc_title}" if moc_input else "Custom military profile"
                 st.success(f"Results for {results_label}")
 
                 if not direct_matches.empty:
                     st.subheader("Stage 1 — Direct MOC-Tagged Matches")
-                    for _, row in direct_matches.head(6).iterrows():
+                    for row in direct_matches.head(6).itertuples(index=False):
                         with st.expander(
-                            f"{row.get('title', 'Untitled')} · {row.get('application_company', 'Unknown Company')} · {row.get('city', 'Unknown City')}"
+                            f"{row.title or 'Untitled'} · {row.application_company or 'Unknown Company'} · {row.city or 'Unknown City'}"
                         ):
                             d1, d2 = st.columns(2)
                             d1.write(
-                                f"Salary: {format_salary(row.get('salary_min', 0), row.get('salary_max', 0), row.get('parameters_salary_unit', ''))}"
+                                f"Salary: {format_salary(row.salary_min, row.salary_max, row.parameters_salary_unit)}"
                             )
                             d2.write(
-                                "Education: "
-                                f"{row.get('requirements_min_education', 'Not specified') or 'Not specified'}"
+                                f"Education: {row.requirements_min_education or 'Not specified'}"
                             )
-                            job_link = str(row.get("link", "")).strip()
+                            job_link = str(row.link).strip()
                             if job_link:
                                 st.link_button("View Job Posting", job_link, use_container_width=True)
 
                 st.subheader("Stage 2 — Skill-Based Matches")
-                for _, row in skill_matches.head(6).iterrows():
+                stage2_rows = skill_matches.head(6)
+                gap_map = compute_skill_gaps(
+                    user_text=combined_query,
+                    job_ids=stage2_rows["system_job_id"].tolist(),
+                    skill_mentions=processed,
+                    limit=10,
+                    skill_rankings=job_skill_rankings,
+                )
+                for row in stage2_rows.to_dict("records"):
                     title = row.get("title", "Untitled")
                     city = row.get("city", "Unknown City")
                     score = float(row.get("match_score", 0))
@@ -890,11 +1017,8 @@ with tab3:
                         if row.get("is_federal", False):
                             st.caption("Federal contractor role — veteran hiring preference may apply.")
 
-                        matched_skills, missing_skills = compute_skill_gap(
-                            user_text=combined_query,
-                            job_id=row.get("system_job_id", ""),
-                            skill_mentions=processed,
-                            limit=10,
+                        matched_skills, missing_skills = gap_map.get(
+                            str(row.get("system_job_id", "")), ([], [])
                         )
 
                         left_gap, right_gap = st.columns(2)
@@ -928,7 +1052,7 @@ with tab4:
     with mi_tab1:
         st.subheader("Credential Inflation Scanner")
         if st.button("Run Credential Inflation Scan", type="primary", key="mi_credential"):
-            ci_df = detect_credential_inflation(jobs_clean)
+            ci_df = _credential_inflation(JOBS_TOKEN)
             if ci_df.empty:
                 st.info("No significant credential inflation pattern detected from current eligible postings.")
             else:
@@ -940,7 +1064,7 @@ with tab4:
 
     with mi_tab2:
         st.subheader("Salary Fairness by City")
-        city_salary = build_salary_by_city(jobs_clean)
+        city_salary = _salary_by_city(JOBS_TOKEN)
         if city_salary.empty:
             st.info("Insufficient salary data to build city-level benchmarks.")
         else:
@@ -956,7 +1080,7 @@ with tab4:
         )
         salary_lookup_city = st.selectbox(
             "City",
-            ["All Cities"] + sorted([city for city in jobs_clean["city"].astype(str).unique() if city.strip()]),
+            city_options,
             key="mi_salary_lookup_city",
         )
 
@@ -964,34 +1088,29 @@ with tab4:
             if not salary_lookup_query.strip():
                 st.warning("Please enter a role to benchmark.")
             else:
-                salary_results = find_matching_jobs(
-                    salary_lookup_query,
-                    jobs_clean,
-                    skill_profiles,
-                    top_n=60,
-                    matching_index=matching_index,
-                )
+                salary_results = _search_jobs(salary_lookup_query, top_n=60)
                 if salary_lookup_city != "All Cities":
-                    salary_results = salary_results[salary_results["city"] == salary_lookup_city]
+                    salary_results = salary_results.query("city == @salary_lookup_city")
 
-                salary_sample = salary_results[salary_results["salary_min"] > 0]
+                salary_sample = _mask_take(salary_results, salary_results["salary_min"] > 0)
                 if len(salary_sample) < 3:
                     st.info("Insufficient salary data for this role and city selection.")
                 else:
-                    salary_values = salary_sample["salary_min"].tolist()
+                    salary_values = salary_sample["salary_min"].to_numpy(dtype=np.float64, copy=False)
+                    p25, p75 = np.quantile(salary_values, [0.25, 0.75])
                     s1, s2, s3, s4 = st.columns(4)
                     s1.metric("Postings Analyzed", f"{len(salary_sample):,}")
-                    s2.metric("Market Average", f"${np.mean(salary_values):,.0f}")
-                    s3.metric("25th Percentile", f"${np.percentile(salary_values, 25):,.0f}")
-                    s4.metric("75th Percentile", f"${np.percentile(salary_values, 75):,.0f}")
+                    s2.metric("Market Average", f"${salary_values.mean():,.0f}")
+                    s3.metric("25th Percentile", f"${p25:,.0f}")
+                    s4.metric("75th Percentile", f"${p75:,.0f}")
 
-                    by_city = salary_sample.groupby("city")["salary_min"].mean().sort_values(ascending=False).head(15)
+                    by_city = salary_sample.groupby("city", sort=False, observed=True)["salary_min"].mean().nlargest(15)
                     if len(by_city) > 1:
                         st.bar_chart(by_city)
 
     with mi_tab3:
         st.subheader("Ghost Job Language Analysis")
-        ghost_terms, real_terms = analyze_ghost_job_language(jobs_clean)
+        ghost_terms, real_terms = _ghost_language_analysis(JOBS_TOKEN)
         if ghost_terms is None or real_terms is None:
             st.info("Insufficient ghost/real description data for robust language comparison.")
         else:
@@ -1005,7 +1124,7 @@ with tab4:
 
     with mi_tab4:
         st.subheader("Education Program vs Job Market Alignment")
-        cip_jobs = jobs_clean[jobs_clean["has_cip"]]
+        cip_jobs = jobs_clean.query("has_cip")
 
         a1, a2 = st.columns(2)
         a1.metric("Postings Linked to CIP Programs", f"{len(cip_jobs):,}")
@@ -1014,12 +1133,18 @@ with tab4:
         if cip_jobs.empty:
             st.info("No CIP-linked postings were found in the current dataset snapshot.")
         else:
-            all_cip_codes: list[str] = []
-            for value in cip_jobs["cip_codes"].dropna():
-                split_codes = str(value).replace("[", "").replace("]", "").replace("'", "").split(",")
-                all_cip_codes.extend([code.strip() for code in split_codes if code.strip() and code.strip() != "nan"])
+            cip_code_values = (
+                cip_jobs["cip_codes"]
+                .dropna()
+                .astype(str)
+                .str.replace(r"[\[\]']", "", regex=True)
+                .str.split(",")
+                .explode()
+                .str.strip()
+            )
+            cip_code_values = cip_code_values[(cip_code_values != "") & (cip_code_values != "nan")]
 
-            cip_counts = pd.Series(all_cip_codes).value_counts().head(25)
+            cip_counts = cip_code_values.value_counts().head(25)
             cip_table = cip_counts.reset_index()
             cip_table.columns = ["CIP Code", "Employer Count"]
 
@@ -1069,7 +1194,7 @@ with tab5:
         benchmark_query = st.text_input("Role or skill profile", placeholder="e.g., data analyst, registered nurse")
         benchmark_city = st.selectbox(
             "Benchmark city",
-            ["All Cities"] + sorted([city for city in jobs_clean["city"].astype(str).unique() if city.strip()]),
+            city_options,
             key="rec_city",
         )
         offered_salary = st.number_input("Planned minimum salary ($)", min_value=0, max_value=500000, value=0, step=5000)
@@ -1078,24 +1203,16 @@ with tab5:
             if not benchmark_query.strip():
                 st.warning("Please enter a role or skill query.")
             else:
-                benchmark_results = find_matching_jobs(
-                    benchmark_query,
-                    jobs_clean,
-                    skill_profiles,
-                    top_n=60,
-                    matching_index=matching_index,
-                )
+                benchmark_results = _search_jobs(benchmark_query, top_n=60)
                 if benchmark_city != "All Cities":
-                    benchmark_results = benchmark_results[benchmark_results["city"] == benchmark_city]
+                    benchmark_results = benchmark_results.query("city == @benchmark_city")
 
-                with_salary = benchmark_results[benchmark_results["salary_min"] > 0]
+                with_salary = _mask_take(benchmark_results, benchmark_results["salary_min"] > 0)
                 if len(with_salary) < 3:
                     st.info("Insufficient salary data for robust benchmarking in this segment.")
                 else:
-                    salaries = with_salary["salary_min"].tolist()
-                    p25 = np.percentile(salaries, 25)
-                    p50 = np.percentile(salaries, 50)
-                    p75 = np.percentile(salaries, 75)
+                    salaries = with_salary["salary_min"].to_numpy(dtype=np.float64, copy=False)
+                    p25, p50, p75 = np.quantile(salaries, [0.25, 0.5, 0.75])
 
                     b1, b2, b3, b4 = st.columns(4)
                     b1.metric("Comparable Postings", f"{len(with_salary):,}")
@@ -1114,19 +1231,19 @@ with tab5:
                             position = "Bottom quartile"
                         st.info(f"Planned salary positioning: {position} for this benchmark set.")
 
-                    preview = with_salary[["title", "application_company", "city", "salary_min", "salary_max"]].head(12).copy()
-                    preview["salary_range"] = preview.apply(
-                        lambda row: format_salary(row["salary_min"], row["salary_max"], row.get("parameters_salary_unit", "")),
-                        axis=1,
-                    )
-                    preview = preview.rename(
-                        columns={
-                            "title": "Job Title",
-                            "application_company": "Employer",
-                            "city": "City",
+                    preview_rows = with_salary.head(12)
+                    preview = pd.DataFrame(
+                        {
+                            "Job Title": preview_rows["title"].to_numpy(),
+                            "Employer": preview_rows["application_company"].to_numpy(),
+                            "City": preview_rows["city"].to_numpy(),
+                            "Salary": format_salary_vec(
+                                preview_rows["salary_min"],
+                                preview_rows["salary_max"],
+                                preview_rows.get("parameters_salary_unit"),
+                            ).to_numpy(),
                         }
-                    )[["Job Title", "Employer", "City", "salary_range"]]
-                    preview = preview.rename(columns={"salary_range": "Salary"})
+                    )
                     st.dataframe(preview, hide_index=True, use_container_width=True)
 
 with tab6:
@@ -1137,10 +1254,10 @@ with tab6:
         f"({sqlite_path.name}, {csv_path.name})."
     )
 
-    analytics_events = load_analytics_events(PROJECT_ROOT)
-    visit_events = analytics_events[analytics_events["event_type"] == "visit"]
-    search_events = analytics_events[analytics_events["event_type"] == "search"]
-    recommendation_events = analytics_events[analytics_events["event_type"] == "recommendation"]
+    analytics_partitions = _analytics_partitions(_analytics_log_token(sqlite_path))
+    visit_events = analytics_partitions["visit"]
+    search_events = analytics_partitions["search"]
+    recommendation_events = analytics_partitions["recommendation"]
 
     total_searches = len(search_events)
     total_recommendations = len(recommendation_events)
@@ -1150,35 +1267,29 @@ with tab6:
     summary_col2.metric("Search Count", f"{total_searches:,}")
     summary_col3.metric("Recommendations Logged", f"{total_recommendations:,}")
 
-    visit_df = visit_events[["timestamp"]].copy()
-    if not visit_df.empty:
-        visit_df["timestamp"] = pd.to_datetime(visit_df["timestamp"])
-        visit_df["hour"] = visit_df["timestamp"].dt.hour
-        visits_by_hour = (
-            visit_df.groupby("hour", as_index=True)
-            .size()
-            .rename("visits")
-            .reindex(range(24), fill_value=0)
+    if not visit_events.empty:
+        visit_hours = visit_events["timestamp"].dt.hour.to_numpy(dtype=np.int8)
+        visits_by_hour = pd.Series(
+            np.bincount(visit_hours, minlength=24), index=range(24), name="visits"
         )
 
         st.subheader("Visit Times (Hour of Day)")
         st.bar_chart(visits_by_hour)
 
-    search_df = search_events[["timestamp", "channel", "results_count"]].copy()
-    search_df["channel"] = search_df["channel"].replace(
-        {
-            "job_seeker": "Job Seeker",
-            "student_field": "Student Field",
-            "veteran": "Veteran",
-        }
-    )
-    if not search_df.empty:
+    if not search_events.empty:
+        channel_labels = search_events["channel"].replace(
+            {
+                "job_seeker": "Job Seeker",
+                "student_field": "Student Field",
+                "veteran": "Veteran",
+            }
+        )
         st.subheader("Search Counter by Workflow")
-        st.bar_chart(search_df["channel"].value_counts())
+        st.bar_chart(channel_labels.value_counts())
 
-        search_df["timestamp"] = pd.to_datetime(search_df["timestamp"])
         searches_over_time = (
-            search_df.set_index("timestamp")
+            search_events[["timestamp"]]
+            .set_index("timestamp")
             .sort_index()
             .resample("h")
             .size()
@@ -1187,13 +1298,14 @@ with tab6:
         st.subheader("Search Activity Over Time")
         st.line_chart(searches_over_time)
 
-    recommendation_df = recommendation_events[["title", "city"]].copy()
-    if not recommendation_df.empty:
+    if not recommendation_events.empty:
         st.subheader("Top Recommended Roles")
-        st.bar_chart(recommendation_df["title"].value_counts().head(10))
+        top_titles = Counter(recommendation_events["title"].tolist()).most_common(10)
+        st.bar_chart(pd.Series(dict(top_titles)))
 
         st.subheader("Recommendations by City")
-        st.bar_chart(recommendation_df["city"].value_counts().head(10))
+        top_cities = Counter(recommendation_events["city"].tolist()).most_common(10)
+        st.bar_chart(pd.Series(dict(top_cities)))
 
 st.markdown("---")
 with st.expander("About This Tool — Transparency & Limitations"):
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import functools
+import operator
 import sqlite3
+import time
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import connectorx
+except ImportError:
+    connectorx = None
 
-EVENT_COLUMNS = [
+
+EVENT_COLUMNS = (
     "timestamp",
     "event_type",
     "channel",
@@ -20,7 +29,27 @@ EVENT_COLUMNS = [
     "direct_count",
     "skill_count",
     "match_score",
-]
+)
+
+_INT_COLUMNS = ("results_count", "direct_count", "skill_count")
+_FLOAT_COLUMNS = ("match_score",)
+
+# Precompiled tuple builder for executemany rows; one C-level call per event.
+_ROW_GETTER = operator.itemgetter(*EVENT_COLUMNS)
+
+_INSERT_SQL = (
+    f"INSERT INTO analytics_events ({', '.join(EVENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(EVENT_COLUMNS))})"
+)
+
+# Buffer events per project root and flush in one transaction once either
+# threshold is hit; per-click connects and fsyncs dominate logging cost.
+_FLUSH_MAX_EVENTS = 32
+_FLUSH_MAX_SECONDS = 2.0
+
+_PENDING: dict[Path, list[dict]] = {}
+_CONNECTIONS: dict[Path, sqlite3.Connection] = {}
+_last_flush = 0.0
 
 
 def _analytics_dir(project_root: Path) -> Path:
@@ -64,85 +93,117 @@ def initialize_analytics_logger(project_root: Path) -> None:
             writer.writeheader()
 
 
-def log_analytics_event(project_root: Path, event: dict) -> None:
+@functools.lru_cache(maxsize=None)
+def _ensure_initialized(project_root: Path) -> None:
     initialize_analytics_logger(project_root)
-    sqlite_path, csv_path = analytics_artifact_paths(project_root)
 
-    normalized_event = {column: event.get(column, "") for column in EVENT_COLUMNS}
-    for numeric_column in ["results_count", "direct_count", "skill_count"]:
-        value = normalized_event[numeric_column]
-        normalized_event[numeric_column] = int(value) if str(value).strip() else None
 
-    score_value = normalized_event["match_score"]
-    normalized_event["match_score"] = float(score_value) if str(score_value).strip() else None
+def _get_connection(project_root: Path) -> sqlite3.Connection:
+    connection = _CONNECTIONS.get(project_root)
+    if connection is None:
+        sqlite_path, _ = analytics_artifact_paths(project_root)
+        connection = sqlite3.connect(sqlite_path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        _CONNECTIONS[project_root] = connection
+    return connection
 
-    with sqlite3.connect(sqlite_path) as connection:
-        connection.execute(
-            """
-            INSERT INTO analytics_events (
-                timestamp,
-                event_type,
-                channel,
-                city_filter,
-                field,
-                moc,
-                title,
-                city,
-                results_count,
-                direct_count,
-                skill_count,
-                match_score
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                normalized_event["timestamp"],
-                normalized_event["event_type"],
-                normalized_event["channel"],
-                normalized_event["city_filter"],
-                normalized_event["field"],
-                normalized_event["moc"],
-                normalized_event["title"],
-                normalized_event["city"],
-                normalized_event["results_count"],
-                normalized_event["direct_count"],
-                normalized_event["skill_count"],
-                normalized_event["match_score"],
-            ),
-        )
-        connection.commit()
 
+def _normalize_event(event: dict) -> dict:
+    normalized_event = {column: event.get(column, "") for column in EVENT_COLUMNS}
+    for column in _INT_COLUMNS:
+        value = normalized_event[column]
+        normalized_event[column] = int(value) if value not in ("", None) else None
+    for column in _FLOAT_COLUMNS:
+        value = normalized_event[column]
+        normalized_event[column] = float(value) if value not in ("", None) else None
+    return normalized_event
+
+
+def _flush(project_root: Path) -> None:
+    pending = _PENDING.get(project_root)
+    if not pending:
+        return
+
+    connection = _get_connection(project_root)
+    connection.execute("BEGIN")
+    connection.executemany(_INSERT_SQL, [_ROW_GETTER(event) for event in pending])
+    connection.execute("COMMIT")
+
+    _, csv_path = analytics_artifact_paths(project_root)
     with csv_path.open("a", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=EVENT_COLUMNS)
-        writer.writerow({column: event.get(column, "") for column in EVENT_COLUMNS})
+        csv.DictWriter(handle, fieldnames=EVENT_COLUMNS).writerows(pending)
+
+    pending.clear()
+
+
+def _flush_all() -> None:
+    for project_root in list(_PENDING):
+        _flush(project_root)
+
+
+atexit.register(_flush_all)
+
+
+def log_analytics_events(project_root: Path, events: list[dict]) -> None:
+    if not events:
+        return
+
+    global _last_flush
+    _ensure_initialized(project_root)
+
+    pending = _PENDING.setdefault(project_root, [])
+    pending.extend(_normalize_event(event) for event in events)
+
+    now = time.monotonic()
+    if len(pending) >= _FLUSH_MAX_EVENTS or now - _last_flush >= _FLUSH_MAX_SECONDS:
+        _flush(project_root)
+        _last_flush = now
+
+
+def log_analytics_event(project_root: Path, event: dict) -> None:
+    log_analytics_events(project_root, [event])
 
 
 def load_analytics_events(project_root: Path) -> pd.DataFrame:
+    _flush(project_root)
+
     sqlite_path, _ = analytics_artifact_paths(project_root)
     if not sqlite_path.exists():
         return pd.DataFrame(columns=EVENT_COLUMNS)
 
-    with sqlite3.connect(sqlite_path) as connection:
-        events = pd.read_sql_query(
-            """
-            SELECT
-                timestamp,
-                event_type,
-                channel,
-                city_filter,
-                field,
-                moc,
-                title,
-                city,
-                results_count,
-                direct_count,
-                skill_count,
-                match_score
-            FROM analytics_events
-            ORDER BY timestamp ASC, id ASC
-            """,
-            connection,
-        )
+    query = f"""
+        SELECT {', '.join(EVENT_COLUMNS)}
+        FROM analytics_events
+        ORDER BY timestamp ASC, id ASC
+    """
+
+    if connectorx is not None:
+        # Arrow bulk fetch skips the per-cell Python conversions of the
+        # sqlite3 adapter; worthwhile once the log grows past a few thousand
+        # events.
+        events = connectorx.read_sql(
+            f"sqlite://{sqlite_path}", query, return_type="arrow"
+        ).to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        with sqlite3.connect(sqlite_path) as connection:
+            events = pd.read_sql_query(query, connection)
 
     if events.empty:
         return pd.DataFrame(columns=EVENT_COLUMNS)
-    return events
\ No newline at end of file
+    return events
+
+
+def load_analytics_partitions(project_root: Path) -> dict[str, pd.DataFrame]:
+    """Load the event log split by event type, with timestamps parsed once."""
+    events = load_analytics_events(project_root)
+    if not events.empty:
+        events["timestamp"] = pd.to_datetime(events["timestamp"], format="ISO8601", cache=True)
+
+    partitions = {
+        str(event_type): frame for event_type, frame in events.groupby("event_type", sort=False)
+    }
+    for event_type in ("visit", "search", "recommendation"):
+        partitions.setdefault(event_type, events.head(0))
+    return partitions
@@ -1,16 +1,14 @@
+from collections.abc import Sequence
 from pathlib import Path
+import shutil
 import zipfile
 
 import pandas as pd
-
-from hackathon.core.nlp_pipeline import (
-    build_skill_profiles_from_mentions,
-    extract_skill_mentions_from_text,
-    infer_education_and_experience,
-)
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 
-REQUIRED_JOB_COLUMNS = [
+REQUIRED_JOB_COLUMNS = (
     "system_job_id",
     "title",
     "description",
@@ -40,7 +38,7 @@ REQUIRED_JOB_COLUMNS = [
     "date_compiled",
     "source_state",
     "classifications_naics_code",
-]
+)
 
 
 def project_root() -> Path:
@@ -60,9 +58,15 @@ def selected_zip_dir() -> Path:
 
 
 def _extract_zip(zip_path: Path, output_dir: Path) -> None:
+    """Stream only the CSV members out with 1 MiB reads, skipping zip cruft."""
     output_dir.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(zip_path, "r") as archive:
-        archive.extractall(output_dir)
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.endswith(".csv"):
+                continue
+            target = output_dir / Path(info.filename).name
+            with archive.open(info) as source, target.open("wb") as destination:
+                shutil.copyfileobj(source, destination, length=1 << 20)
 
 
 def prepare_raw_data() -> tuple[Path, Path]:
@@ -94,29 +98,163 @@ def prepare_raw_data() -> tuple[Path, Path]:
     return jobs_csv, processed_csv
 
 
-def _ensure_columns(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    for column in columns:
-        if column not in frame.columns:
-            frame[column] = ""
+PROCESSED_SKILL_COLUMNS = (
+    "Research ID",
+    "Raw Skill",
+    "Taxonomy Skill",
+    "Taxonomy Source",
+    "Correlation Coefficient",
+)
+
+
+# Columns that must parse as strings; numeric-looking ids (or all-numeric MOC
+# codes) would otherwise come back as ints and force a full per-row re-cast
+# after every load.
+_ID_COLUMN_DTYPES = {
+    "system_job_id": "string[pyarrow]",
+    "Research ID": "string[pyarrow]",
+    "moc_codes": "string[pyarrow]",
+}
+
+
+def _coerce_id_strings(frame: pd.DataFrame) -> pd.DataFrame:
+    for column, dtype in _ID_COLUMN_DTYPES.items():
+        if column in frame.columns and not pd.api.types.is_string_dtype(frame[column]):
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def _read_csv_arrow(path: Path, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Parse with the multi-threaded Arrow reader, keeping only known columns."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = None
+    if columns is not None:
+        usecols = [column for column in columns if column in header]
+    forced_strings = [column for column in _ID_COLUMN_DTYPES if column in header]
+    try:
+        # Arrow is called directly rather than through pandas' engine wrapper
+        # so newlines_in_values can be enabled: quoted description fields
+        # carry embedded line breaks that the default parser rejects.
+        table = pa_csv.read_csv(
+            path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=usecols,
+                column_types={column: pa.string() for column in forced_strings},
+            ),
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    except pa.ArrowInvalid:
+        # Rows Arrow still refuses fall back to pandas' forgiving C parser.
+        dtype = {column: _ID_COLUMN_DTYPES[column] for column in forced_strings}
+        return pd.read_csv(path, dtype_backend="pyarrow", usecols=usecols, dtype=dtype or None)
+
+
+def _read_raw_table(csv_path: Path, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Read a raw table through a Parquet sidecar cache, refreshing it from CSV."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        frame = pd.read_parquet(parquet_path, engine="pyarrow")
+        if columns is not None:
+            frame = frame[[column for column in columns if column in frame.columns]]
+        return _coerce_id_strings(frame)
+
+    frame = _read_csv_arrow(csv_path, columns)
+    try:
+        frame.to_parquet(parquet_path, compression="zstd", index=False)
+    except (ImportError, OSError, ValueError):
+        # The sidecar is purely an accelerator; keep serving the CSV parse.
+        pass
+    return frame
+
+
+def _fill_missing(frame: pd.DataFrame) -> pd.DataFrame:
+    """Arrow-dtype-safe fillna: blanks for string columns, zero for numeric ones."""
+    for column, dtype in frame.dtypes.items():
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype):
+            # All-null columns come off the Arrow read as null[pyarrow],
+            # which rejects any fill value; give them a string dtype first.
+            frame[column] = frame[column].astype("string[pyarrow]")
+            dtype = frame[column].dtype
+        if pd.api.types.is_numeric_dtype(dtype):
+            frame[column] = frame[column].fillna(0)
+        elif pd.api.types.is_string_dtype(dtype):
+            frame[column] = frame[column].fillna("")
+    return frame
+
+
+def _ensure_columns(frame: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        # One reindex beats per-column inserts that each reshuffle the blocks.
+        frame = frame.reindex(columns=[*frame.columns, *missing], fill_value="")
     return frame
 
 
 def _nlp_artifact_paths() -> tuple[Path, Path]:
     output_dir = processed_data_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
-    mentions_path = output_dir / "nlp_skill_mentions.csv"
-    profiles_path = output_dir / "nlp_skill_profiles.csv"
+    mentions_path = output_dir / "nlp_skill_mentions.parquet"
+    profiles_path = output_dir / "nlp_skill_profiles.parquet"
     return mentions_path, profiles_path
 
 
 def _requirements_profile_path() -> Path:
     output_dir = processed_data_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir / "nlp_requirements_profile.csv"
+    return output_dir / "nlp_requirements_profile.parquet"
+
+
+def _requirements_fingerprint_path() -> Path:
+    return _requirements_profile_path().with_suffix(".fingerprint")
+
+
+def _requirements_fingerprint(jobs_clean: pd.DataFrame) -> str:
+    """Cheap identity for the job-id column: row count plus a summed hash."""
+    id_hash = int(pd.util.hash_pandas_object(jobs_clean["system_job_id"], index=False).sum())
+    return f"{len(jobs_clean)}:{id_hash}"
+
+
+def _merged_jobs_path() -> Path:
+    output_dir = processed_data_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / "jobs_clean_merged.parquet"
+
+
+def _load_cached_requirements_fingerprint() -> str | None:
+    fingerprint_path = _requirements_fingerprint_path()
+    if not fingerprint_path.exists():
+        return None
+    return fingerprint_path.read_text(encoding="utf-8").strip() or None
+
+
+# Worker processes only pay for themselves once the regex pass has enough
+# rows; below this the fork/serialize overhead dominates.
+_PARALLEL_MIN_ROWS = 2000
 
 
 def _generate_requirements_profile(jobs_clean: pd.DataFrame) -> pd.DataFrame:
-    requirements_profile = infer_education_and_experience(jobs_clean)
+    # Imported lazily: the NLP pipeline drags in sklearn, which warm-cache
+    # startups (the common case) never need.
+    from hackathon.core.nlp_pipeline import infer_education_and_experience
+
+    if len(jobs_clean) >= _PARALLEL_MIN_ROWS:
+        import os
+
+        import numpy as np
+        from joblib import Parallel, delayed
+
+        # Split positions, not the frame: array_split on a DataFrame hands
+        # back bare ndarrays under numpy 2, losing the column structure.
+        position_chunks = np.array_split(np.arange(len(jobs_clean)), os.cpu_count() or 1)
+        profiles = Parallel(n_jobs=-1, backend="loky")(
+            delayed(infer_education_and_experience)(jobs_clean.iloc[positions])
+            for positions in position_chunks
+            if len(positions)
+        )
+        requirements_profile = pd.concat(profiles, ignore_index=True)
+    else:
+        requirements_profile = infer_education_and_experience(jobs_clean)
     requirements_profile = _ensure_columns(
         requirements_profile,
         [
@@ -128,7 +266,10 @@ def _generate_requirements_profile(jobs_clean: pd.DataFrame) -> pd.DataFrame:
         ],
     ).fillna("")
     requirements_profile["system_job_id"] = requirements_profile["system_job_id"].astype(str)
-    requirements_profile.to_csv(_requirements_profile_path(), index=False)
+    requirements_profile.to_parquet(_requirements_profile_path(), compression="zstd", index=False)
+    _requirements_fingerprint_path().write_text(
+        _requirements_fingerprint(jobs_clean), encoding="utf-8"
+    )
     return requirements_profile
 
 
@@ -137,7 +278,7 @@ def _load_cached_requirements_profile() -> pd.DataFrame | None:
     if not requirements_path.exists():
         return None
 
-    requirements_profile = pd.read_csv(requirements_path)
+    requirements_profile = pd.read_parquet(requirements_path)
     requirements_profile = _ensure_columns(
         requirements_profile,
         [
@@ -152,7 +293,7 @@ def _load_cached_requirements_profile() -> pd.DataFrame | None:
     if requirements_profile.empty:
         return None
 
-    requirements_profile["system_job_id"] = requirements_profile["system_job_id"].astype(str)
+    # Parquet preserves the string dtypes written above, so no re-coercion.
     requirements_profile = requirements_profile.drop_duplicates(subset=["system_job_id"], keep="first")
     return requirements_profile
 
@@ -161,6 +302,11 @@ def _generate_nlp_structured_data(
     jobs_clean: pd.DataFrame,
     processed: pd.DataFrame,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    from hackathon.core.nlp_pipeline import (
+        build_skill_profiles_from_mentions,
+        extract_skill_mentions_from_text,
+    )
+
     mentions = extract_skill_mentions_from_text(jobs_clean, processed)
 
     if mentions.empty:
@@ -175,8 +321,8 @@ def _generate_nlp_structured_data(
     skill_profiles["system_job_id"] = skill_profiles["system_job_id"].astype(str)
 
     mentions_path, profiles_path = _nlp_artifact_paths()
-    mentions.to_csv(mentions_path, index=False)
-    skill_profiles.to_csv(profiles_path, index=False)
+    mentions.to_parquet(mentions_path, compression="zstd", index=False)
+    skill_profiles.to_parquet(profiles_path, compression="zstd", index=False)
 
     return mentions, skill_profiles
 
@@ -186,8 +332,8 @@ def _load_cached_nlp_structured_data() -> tuple[pd.DataFrame, pd.DataFrame] | tu
     if not mentions_path.exists() or not profiles_path.exists():
         return None, None
 
-    mentions = pd.read_csv(mentions_path)
-    skill_profiles = pd.read_csv(profiles_path)
+    mentions = pd.read_parquet(mentions_path)
+    skill_profiles = pd.read_parquet(profiles_path)
 
     mentions = _ensure_columns(mentions, ["Research ID", "Taxonomy Skill", "NLP Score"])
     skill_profiles = _ensure_columns(skill_profiles, ["system_job_id", "skill_text"])
@@ -195,37 +341,49 @@ def _load_cached_nlp_structured_data() -> tuple[pd.DataFrame, pd.DataFrame] | tu
     if mentions.empty or skill_profiles.empty:
         return None, None
 
-    mentions["Research ID"] = mentions["Research ID"].astype(str)
-    skill_profiles["system_job_id"] = skill_profiles["system_job_id"].astype(str)
-
     return mentions, skill_profiles
 
 
 def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     jobs_path, processed_path = prepare_raw_data()
 
-    jobs = pd.read_csv(jobs_path)
-    processed = pd.read_csv(processed_path)
+    jobs = _read_raw_table(jobs_path, REQUIRED_JOB_COLUMNS)
+    processed = _read_raw_table(processed_path, PROCESSED_SKILL_COLUMNS)
 
     jobs = _ensure_columns(jobs, REQUIRED_JOB_COLUMNS)
-    jobs_clean = jobs[REQUIRED_JOB_COLUMNS].fillna("").copy()
-    jobs_clean["system_job_id"] = jobs_clean["system_job_id"].astype(str)
-
-    requirements_profile = _load_cached_requirements_profile()
-    if requirements_profile is None:
-        requirements_profile = _generate_requirements_profile(jobs_clean)
+    jobs_clean = _fill_missing(jobs[list(REQUIRED_JOB_COLUMNS)].copy())
+    # Already a string column at ingestion; categorical merge keys hash int
+    # codes rather than one Python str per row.
+    jobs_clean["system_job_id"] = jobs_clean["system_job_id"].astype("category")
+
+    fingerprint = _requirements_fingerprint(jobs_clean)
+    merged_jobs_path = _merged_jobs_path()
+    if merged_jobs_path.exists() and _load_cached_requirements_fingerprint() == fingerprint:
+        # The merged table already carries the education/experience columns,
+        # so a matching fingerprint skips the profile read+merge+fillna chain.
+        jobs_clean = pd.read_parquet(merged_jobs_path)
     else:
-        required_ids = set(jobs_clean["system_job_id"])
-        cached_ids = set(requirements_profile["system_job_id"])
-        if required_ids != cached_ids:
+        requirements_profile = None
+        if _load_cached_requirements_fingerprint() == fingerprint:
+            requirements_profile = _load_cached_requirements_profile()
+        if requirements_profile is None:
             requirements_profile = _generate_requirements_profile(jobs_clean)
 
-    jobs_clean = jobs_clean.merge(requirements_profile, on="system_job_id", how="left")
-    jobs_clean = jobs_clean.fillna("")
+        requirements_profile = requirements_profile.copy()
+        requirements_profile["system_job_id"] = requirements_profile["system_job_id"].astype(
+            jobs_clean["system_job_id"].dtype
+        )
+        jobs_clean = jobs_clean.merge(requirements_profile, on="system_job_id", how="left")
+        jobs_clean = _fill_missing(jobs_clean)
+        jobs_clean.to_parquet(merged_jobs_path, compression="zstd", index=False)
+
+    if "moc_codes" in jobs_clean.columns:
+        # The same multi-code MOC combinations repeat across postings; the
+        # dictionary encoding keeps one copy of each distinct string.
+        jobs_clean["moc_codes"] = jobs_clean["moc_codes"].astype("category")
 
     required_processed_columns = ["Research ID", "Taxonomy Skill", "Correlation Coefficient"]
-    processed = _ensure_columns(processed, required_processed_columns).fillna("")
-    processed["Research ID"] = processed["Research ID"].astype(str)
+    processed = _fill_missing(_ensure_columns(processed, required_processed_columns))
 
     nlp_mentions, skill_profiles = _load_cached_nlp_structured_data()
     if nlp_mentions is None or skill_profiles is None:
@@ -236,16 +394,8 @@ def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
 
 def load_raw_skill_records() -> pd.DataFrame:
     _, processed_path = prepare_raw_data()
-    processed = pd.read_csv(processed_path)
-    expected_columns = [
-        "Research ID",
-        "Raw Skill",
-        "Taxonomy Skill",
-        "Taxonomy Source",
-        "Correlation Coefficient",
-    ]
-    processed = _ensure_columns(processed, expected_columns).fillna("")
-    processed["Research ID"] = processed["Research ID"].astype(str)
+    processed = _read_raw_table(processed_path, PROCESSED_SKILL_COLUMNS)
+    processed = _fill_missing(_ensure_columns(processed, PROCESSED_SKILL_COLUMNS))
     processed["Correlation Coefficient"] = pd.to_numeric(
         processed["Correlation Coefficient"], errors="coerce"
     ).fillna(0)
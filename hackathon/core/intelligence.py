@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 
 import numpy as np
@@ -7,6 +8,7 @@ import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 
+@functools.lru_cache(maxsize=4096)
 def format_salary(salary_min, salary_max, salary_unit: str = "") -> str:
     try:
         minimum = float(salary_min) if str(salary_min).strip() not in {"", "nan", "0", "0.0"} else 0
@@ -28,6 +30,28 @@ def format_salary(salary_min, salary_max, salary_unit: str = "") -> str:
         return "Not disclosed"
 
 
+def format_salary_vec(salary_min, salary_max, salary_unit=None) -> pd.Series:
+    """Vectorized counterpart of format_salary for whole columns."""
+    minimum = pd.to_numeric(salary_min, errors="coerce").fillna(0)
+    maximum = pd.to_numeric(salary_max, errors="coerce").fillna(0).to_numpy()
+
+    if salary_unit is None:
+        unit = np.full(len(minimum), "", dtype=object)
+    else:
+        # fillna before astype: None/NA would otherwise survive into the
+        # object array and break the " / " + unit concatenation below.
+        unit_series = pd.Series(salary_unit).fillna("").astype(str).str.strip()
+        unit = unit_series.where(unit_series.str.lower() != "nan", "").to_numpy(dtype=object)
+
+    suffix = np.where(unit != "", " / " + unit, np.where(maximum > 0, " / year", ""))
+    min_text = np.array([f"${value:,.0f}" for value in minimum.to_numpy()], dtype=object)
+    max_text = np.array([f"${value:,.0f}" for value in maximum], dtype=object)
+
+    formatted = np.where(maximum > 0, min_text + " — " + max_text + suffix, min_text + "+" + suffix)
+    formatted = np.where(minimum.to_numpy() <= 0, "Not disclosed", formatted)
+    return pd.Series(formatted, index=minimum.index)
+
+
 def detect_emerging_skills(
     processed_raw: pd.DataFrame,
     confidence_threshold: float = 0.65,
@@ -45,12 +69,34 @@ def detect_emerging_skills(
     if uncertain.empty:
         return pd.DataFrame()
 
-    grouped = uncertain.groupby("Raw Skill", as_index=False).agg(
+    uncertain["Raw Skill"] = uncertain["Raw Skill"].astype("category")
+
+    def _top_value(column: str) -> pd.DataFrame:
+        """Most frequent value of `column` per Raw Skill via one size() pass."""
+        return (
+            uncertain.groupby(["Raw Skill", column], observed=True)
+            .size()
+            .reset_index(name="n")
+            .sort_values("n", ascending=False, kind="stable")
+            .drop_duplicates("Raw Skill")[["Raw Skill", column]]
+        )
+
+    grouped = uncertain.groupby("Raw Skill", as_index=False, observed=True).agg(
         employer_count=("Research ID", "nunique"),
         avg_confidence=("Correlation Coefficient", "mean"),
-        closest_taxonomy=("Taxonomy Skill", lambda values: values.mode().iloc[0] if len(values.mode()) else ""),
-        taxonomy_source=("Taxonomy Source", lambda values: values.mode().iloc[0] if len(values.mode()) else ""),
     )
+    grouped = grouped.merge(
+        _top_value("Taxonomy Skill").rename(columns={"Taxonomy Skill": "closest_taxonomy"}),
+        on="Raw Skill",
+        how="left",
+    ).merge(
+        _top_value("Taxonomy Source").rename(columns={"Taxonomy Source": "taxonomy_source"}),
+        on="Raw Skill",
+        how="left",
+    )
+    grouped[["closest_taxonomy", "taxonomy_source"]] = grouped[
+        ["closest_taxonomy", "taxonomy_source"]
+    ].fillna("")
 
     grouped = grouped[grouped["employer_count"] >= min_employers]
     grouped = grouped[~grouped["Raw Skill"].astype(str).str.match(r"^\d+$")]
@@ -74,25 +120,26 @@ def analyze_ghost_job_language(jobs_clean: pd.DataFrame) -> tuple[pd.DataFrame |
         return None, None
 
     vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), max_features=5000)
-    vectorizer.fit([ghost_text, real_text])
-
-    ghost_vector = vectorizer.transform([ghost_text]).toarray()[0]
-    real_vector = vectorizer.transform([real_text]).toarray()[0]
-
-    comparison = pd.DataFrame(
-        {
-            "term": vectorizer.get_feature_names_out(),
-            "ghost_tfidf": ghost_vector,
-            "real_tfidf": real_vector,
-        }
-    )
-    comparison["ghost_dominance"] = comparison["ghost_tfidf"] - comparison["real_tfidf"]
-
-    ghost_terms = comparison.nlargest(15, "ghost_dominance")[["term", "ghost_tfidf"]].rename(
-        columns={"term": "Term", "ghost_tfidf": "TF-IDF Score"}
+    matrix = vectorizer.fit_transform([ghost_text, real_text])
+
+    ghost_vector = matrix[0].toarray().ravel()
+    real_vector = matrix[1].toarray().ravel()
+    feature_names = vectorizer.get_feature_names_out()
+
+    # Only the top 15 terms per side are shown; argpartition picks them
+    # without building a full-vocabulary comparison frame.
+    dominance = ghost_vector - real_vector
+    k = min(15, dominance.size)
+    ghost_top = np.argpartition(-dominance, k - 1)[:k]
+    ghost_top = ghost_top[np.argsort(-dominance[ghost_top])]
+    real_top = np.argpartition(-real_vector, k - 1)[:k]
+    real_top = real_top[np.argsort(-real_vector[real_top])]
+
+    ghost_terms = pd.DataFrame(
+        {"Term": feature_names[ghost_top], "TF-IDF Score": ghost_vector[ghost_top]}
     )
-    real_terms = comparison.nlargest(15, "real_tfidf")[["term", "real_tfidf"]].rename(
-        columns={"term": "Term", "real_tfidf": "TF-IDF Score"}
+    real_terms = pd.DataFrame(
+        {"Term": feature_names[real_top], "TF-IDF Score": real_vector[real_top]}
     )
     return ghost_terms, real_terms
 
@@ -131,76 +178,104 @@ def detect_credential_inflation(jobs_clean: pd.DataFrame) -> pd.DataFrame:
     if jobs_clean.empty or not required_columns.issubset(jobs_clean.columns):
         return pd.DataFrame()
 
-    working = jobs_clean.copy()
-    working["edu_normalized"] = (
-        working["requirements_min_education"]
-        .astype(str)
-        .str.strip()
-        .str.title()
+    edu_normalized = jobs_clean["requirements_min_education"].astype(str).str.strip().str.title()
+    onet_code = jobs_clean["classifications_onet_code"].astype(str).str.strip()
+
+    # Copy only the columns the report touches; a full-frame copy drags every
+    # description column through memory for nothing.
+    display_columns = (
+        "title",
+        "application_company",
+        "city",
+        "salary_min",
+        "salary_max",
+        "parameters_salary_min",
+        "parameters_salary_max",
     )
-
-    eligible = working[
-        working["edu_normalized"].isin(education_rank.keys())
-        & (working["classifications_onet_code"].astype(str).str.strip() != "")
-    ].copy()
+    needed = ["requirements_min_education", "classifications_onet_code"] + [
+        column for column in display_columns if column in jobs_clean.columns
+    ]
+    eligible = jobs_clean.loc[edu_normalized.isin(education_rank) & onet_code.ne(""), needed].copy()
     if eligible.empty:
         return pd.DataFrame()
 
-    eligible["edu_level"] = eligible["edu_normalized"].map(education_rank)
-
-    flagged_rows: list[dict] = []
-    for onet_code, group in eligible.groupby("classifications_onet_code"):
-        if len(group) < 3:
-            continue
-
-        minimum = group["edu_level"].min()
-        for _, row in group.iterrows():
-            gap = int(row["edu_level"] - minimum)
-            if gap >= 2:
-                flagged_rows.append(
-                    {
-                        "Job Title": row.get("title", ""),
-                        "Employer": row.get("application_company", ""),
-                        "City": row.get("city", ""),
-                        "Required Education": row.get("requirements_min_education", ""),
-                        "Minimum in Same Field": inverse_rank.get(int(minimum), "Unknown"),
-                        "Gap (levels)": gap,
-                        "Education Gap (levels)": gap,
-                        "O*NET Code": onet_code,
-                        "Salary": format_salary(
-                            row.get("salary_min", row.get("parameters_salary_min", "")),
-                            row.get("salary_max", row.get("parameters_salary_max", "")),
-                        ),
-                    }
-                )
-
-    if not flagged_rows:
+    eligible["edu_level"] = edu_normalized[eligible.index].map(education_rank)
+
+    # Two transform() columns replace the per-group/per-row Python loop: every
+    # posting carries its field minimum and group size, then one mask flags.
+    grouped = eligible.groupby("classifications_onet_code")["edu_level"]
+    eligible["min_edu"] = grouped.transform("min")
+    eligible["group_size"] = grouped.transform("size")
+    eligible["gap"] = (eligible["edu_level"] - eligible["min_edu"]).astype(int)
+
+    flagged = eligible[(eligible["group_size"] >= 3) & (eligible["gap"] >= 2)]
+    if flagged.empty:
         return pd.DataFrame()
 
-    return pd.DataFrame(flagged_rows).sort_values("Gap (levels)", ascending=False).head(150)
+    def _salary_column(primary: str, fallback: str) -> pd.Series:
+        if primary in flagged.columns:
+            return flagged[primary]
+        if fallback in flagged.columns:
+            return flagged[fallback]
+        # format_salary_vec needs a Series; a scalar default would crash it.
+        return pd.Series(0, index=flagged.index)
+
+    salary_min = _salary_column("salary_min", "parameters_salary_min")
+    salary_max = _salary_column("salary_max", "parameters_salary_max")
+
+    result = pd.DataFrame(
+        {
+            "Job Title": flagged.get("title", ""),
+            "Employer": flagged.get("application_company", ""),
+            "City": flagged.get("city", ""),
+            "Required Education": flagged["requirements_min_education"],
+            "Minimum in Same Field": flagged["min_edu"].astype(int).map(inverse_rank).fillna("Unknown"),
+            "Gap (levels)": flagged["gap"],
+            "Education Gap (levels)": flagged["gap"],
+            "O*NET Code": flagged["classifications_onet_code"],
+            "Salary": format_salary_vec(salary_min, salary_max),
+        }
+    )
+    return result.sort_values("Gap (levels)", ascending=False).head(150).reset_index(drop=True)
 
 
 def build_salary_by_city(jobs_clean: pd.DataFrame) -> pd.DataFrame:
-    if jobs_clean.empty or "city" not in jobs_clean.columns:
+    if jobs_clean.empty or not {"city", "salary_min", "system_job_id"}.issubset(jobs_clean.columns):
         return pd.DataFrame()
 
-    with_salary = jobs_clean[(jobs_clean.get("salary_min", 0) > 0) & (jobs_clean["city"].astype(str).str.strip() != "")].copy()
+    mask = (jobs_clean["salary_min"] > 0) & (jobs_clean["city"].astype(str).str.strip() != "")
+    with_salary = jobs_clean.loc[mask, ["city", "salary_min", "system_job_id"]].copy()
     if with_salary.empty:
         return pd.DataFrame()
 
-    city_stats = with_salary.groupby("city", as_index=False).agg(
+    with_salary["city"] = with_salary["city"].astype("category")
+    grouped = with_salary.groupby("city", observed=True)
+    city_stats = grouped.agg(
         avg_min=("salary_min", "mean"),
         median_min=("salary_min", "median"),
-        p25=("salary_min", lambda values: np.percentile(values, 25)),
-        p75=("salary_min", lambda values: np.percentile(values, 75)),
         max_sal=("salary_min", "max"),
         job_count=("system_job_id", "count"),
     )
+    # groupby.quantile stays in C for both percentiles; the old per-group
+    # np.percentile lambdas ran a Python call per city.
+    quantiles = grouped["salary_min"].quantile([0.25, 0.75]).unstack()
+    quantiles.columns = ["p25", "p75"]
+    city_stats = city_stats.join(quantiles).reset_index()
+    city_stats = city_stats[["city", "avg_min", "median_min", "p25", "p75", "max_sal", "job_count"]]
 
     city_stats = city_stats[city_stats["job_count"] >= 3]
     return city_stats.sort_values("avg_min", ascending=False).reset_index(drop=True)
 
 
+_QUANTIFIED_REQUIREMENT_RE = re.compile(r"\d+\s*[\+\-]?\s*(?:year|month|week|yr)")
+
+_EMPTY = frozenset({"", "nan", "none", "null"})
+
+
+def _is_empty(value) -> bool:
+    return str(value).strip().lower() in _EMPTY
+
+
 def score_description(
     description: str,
     salary_min,
@@ -233,19 +308,19 @@ def score_description(
     except (TypeError, ValueError):
         breakdown["Salary Transparency"] = "No salary listed."
 
-    if str(education_requirement).strip().lower() not in {"", "nan", "none"}:
+    if not _is_empty(education_requirement):
         score += 15
         breakdown["Education Requirement"] = f"Clearly stated: {education_requirement}"
     else:
         breakdown["Education Requirement"] = "Not specified. Adds applicant uncertainty."
 
-    if str(experience_requirement).strip().lower() not in {"", "nan", "none"}:
+    if not _is_empty(experience_requirement):
         score += 15
         breakdown["Experience Requirement"] = f"Clearly stated: {experience_requirement}"
     else:
         breakdown["Experience Requirement"] = "Not specified. Adds applicant uncertainty."
 
-    quantified = len(re.findall(r"\d+\s*[\+\-]?\s*(?:year|month|week|yr)", str(description).lower()))
+    quantified = len(_QUANTIFIED_REQUIREMENT_RE.findall(str(description).lower()))
     if quantified >= 2:
         score += 15
         breakdown["Specificity"] = f"Contains {quantified} quantified requirements."
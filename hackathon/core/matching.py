@@ -1,17 +1,136 @@
+import functools
+from pathlib import Path
+
+import joblib
+import numpy as np
 import pandas as pd
+from scipy import sparse
+from sklearn.decomposition import TruncatedSVD
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Brute-force cosine is fast enough below this row count; the ANN index
+# only pays for itself (build cost + approximation) on larger corpora.
+ANN_MIN_ROWS = 2000
+ANN_COMPONENTS = 256
+
+
+def _build_ann_index(matrix) -> tuple[TruncatedSVD, object] | None:
+    if faiss is None or matrix.shape[0] < ANN_MIN_ROWS:
+        return None
+
+    components = min(ANN_COMPONENTS, matrix.shape[1] - 1)
+    if components < 2:
+        return None
+
+    svd = TruncatedSVD(n_components=components, random_state=0)
+    embeddings = normalize(svd.fit_transform(matrix)).astype(np.float32)
+    index = faiss.IndexHNSWFlat(components, 32, faiss.METRIC_INNER_PRODUCT)
+    index.hnsw.efConstruction = 200
+    index.add(embeddings)
+    return svd, index
+
+
+def _index_signature(skill_profiles: pd.DataFrame) -> str:
+    """Cheap identity for the profile texts: row count plus a summed hash.
+
+    The version prefix invalidates indexes persisted under different
+    vectorizer settings.
+    """
+    text_hash = int(pd.util.hash_pandas_object(skill_profiles["skill_text"], index=False).sum())
+    return f"tfidf-v2:{len(skill_profiles)}:{text_hash}"
+
+
+def _load_persisted_index(
+    cache_dir: Path, signature: str
+) -> tuple[TfidfVectorizer, object, np.ndarray] | None:
+    signature_path = cache_dir / "tfidf_index.signature"
+    try:
+        if signature_path.read_text(encoding="utf-8").strip() != signature:
+            return None
+        vectorizer = joblib.load(cache_dir / "tfidf_vec.joblib")
+        matrix = sparse.load_npz(cache_dir / "tfidf_X.npz")
+        job_ids = joblib.load(cache_dir / "tfidf_job_ids.joblib")
+    except (OSError, ValueError, EOFError):
+        return None
+    return vectorizer, matrix, job_ids
+
+
+def _persist_index(
+    cache_dir: Path, signature: str, vectorizer: TfidfVectorizer, matrix, job_ids: np.ndarray
+) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        sparse.save_npz(cache_dir / "tfidf_X.npz", matrix)
+        joblib.dump(vectorizer, cache_dir / "tfidf_vec.joblib", compress=3)
+        joblib.dump(job_ids, cache_dir / "tfidf_job_ids.joblib", compress=3)
+        (cache_dir / "tfidf_index.signature").write_text(signature, encoding="utf-8")
+    except OSError:
+        # The persisted index is purely an accelerator; serve the fresh fit.
+        pass
 
 
 def build_matching_index(
     skill_profiles: pd.DataFrame,
-) -> tuple[TfidfVectorizer, object, list[str]]:
+    cache_dir: Path | None = None,
+) -> tuple[TfidfVectorizer, object, np.ndarray, tuple | None]:
+    signature = _index_signature(skill_profiles) if cache_dir is not None else ""
+    if cache_dir is not None:
+        persisted = _load_persisted_index(cache_dir, signature)
+        if persisted is not None:
+            vectorizer, matrix, job_ids = persisted
+            return vectorizer, matrix, job_ids, _build_ann_index(matrix)
+
     texts = skill_profiles["skill_text"].fillna("").astype(str).tolist()
-    job_ids = skill_profiles["system_job_id"].astype(str).tolist()
+    job_ids = skill_profiles["system_job_id"].astype(str).to_numpy(dtype=object)
 
     vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2))
     matrix = vectorizer.fit_transform(texts)
-    return vectorizer, matrix, job_ids
+    # L2-normalize once at build time so query scoring is a bare dot product.
+    matrix = normalize(matrix, norm="l2", copy=False)
+    if cache_dir is not None:
+        _persist_index(cache_dir, signature, vectorizer, matrix, job_ids)
+    return vectorizer, matrix, job_ids, _build_ann_index(matrix)
+
+
+# Fallback memo for callers that pass no prebuilt index: keyed on the profile
+# frame's identity so repeat queries reuse the fitted vectorizer and matrix.
+_INDEX_CACHE: dict[tuple[int, int], tuple] = {}
+_INDEX_CACHE_MAX = 4
+
+
+def _cached_index(skill_profiles: pd.DataFrame) -> tuple:
+    key = (id(skill_profiles), len(skill_profiles))
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_MAX:
+            _INDEX_CACHE.pop(next(iter(_INDEX_CACHE)))
+        index = build_matching_index(skill_profiles)
+        _INDEX_CACHE[key] = index
+    return index
+
+
+# The veteran flow replays a small set of canned query strings; transforming
+# one is pure given a fitted vectorizer, so query vectors are memoized per
+# (vectorizer, query) pair.
+_QUERY_VECTOR_CACHE: dict[tuple[int, str], object] = {}
+_QUERY_VECTOR_CACHE_MAX = 128
+
+
+def _query_vector(vectorizer: TfidfVectorizer, query: str):
+    key = (id(vectorizer), query)
+    vector = _QUERY_VECTOR_CACHE.get(key)
+    if vector is None:
+        vector = normalize(vectorizer.transform([query]))
+        if len(_QUERY_VECTOR_CACHE) >= _QUERY_VECTOR_CACHE_MAX:
+            _QUERY_VECTOR_CACHE.pop(next(iter(_QUERY_VECTOR_CACHE)))
+        _QUERY_VECTOR_CACHE[key] = vector
+    return vector
 
 
 def find_matching_jobs(
@@ -19,30 +138,180 @@ def find_matching_jobs(
     jobs_clean: pd.DataFrame,
     skill_profiles: pd.DataFrame,
     top_n: int = 8,
-    matching_index: tuple[TfidfVectorizer, object, list[str]] | None = None,
+    matching_index: tuple | None = None,
+    jobs_indexed: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     if skill_profiles.empty:
         return jobs_clean.head(0).copy()
 
     if matching_index is None:
-        vectorizer, matrix, job_ids = build_matching_index(skill_profiles)
-    else:
-        vectorizer, matrix, job_ids = matching_index
+        matching_index = _cached_index(skill_profiles)
+    vectorizer, matrix, job_ids = matching_index[:3]
+    ann_index = matching_index[3] if len(matching_index) > 3 else None
+
+    user_vector = _query_vector(vectorizer, str(user_input))
 
-    user_vector = vectorizer.transform([str(user_input)])
-    similarities = cosine_similarity(user_vector, matrix)[0]
+    job_ids = np.asarray(job_ids, dtype=object)
 
-    top_indices = similarities.argsort()[-top_n:][::-1]
-    top_ids = [job_ids[index] for index in top_indices]
-    top_scores = [similarities[index] for index in top_indices]
+    if ann_index is not None:
+        svd, index = ann_index
+        query = normalize(svd.transform(user_vector)).astype(np.float32)
+        scores, indices = index.search(query, top_n)
+        keep = indices[0] >= 0
+        top_ids = job_ids[indices[0][keep]].tolist()
+        top_scores = [float(score) for score in scores[0][keep]]
+    else:
+        # Both sides are unit vectors, so cosine similarity is one sparse
+        # matvec; argpartition pulls the top-k without a full sort.
+        similarities = (matrix @ user_vector.T).toarray().ravel()
+        count = min(top_n, similarities.size)
+        top_indices = np.argpartition(-similarities, count - 1)[:count]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
+        top_ids = job_ids[top_indices].tolist()
+        top_scores = similarities[top_indices].tolist()
 
-    results = jobs_clean[jobs_clean["system_job_id"].isin(top_ids)].copy()
+    if jobs_indexed is not None:
+        candidate_ids = pd.Index(top_ids)
+        results = jobs_indexed.loc[candidate_ids[candidate_ids.isin(jobs_indexed.index)]].copy()
+    else:
+        results = jobs_clean[jobs_clean["system_job_id"].isin(top_ids)].copy()
     score_map = dict(zip(top_ids, top_scores))
     results["match_score"] = results["system_job_id"].map(score_map)
 
     return results.sort_values("match_score", ascending=False).head(top_n)
 
 
+def build_job_skill_rankings(skill_mentions: pd.DataFrame) -> dict[str, tuple[str, ...]]:
+    """Precompute each job's skills ranked by score for O(1) per-job lookup."""
+    required_columns = {"Research ID", "Taxonomy Skill"}
+    if skill_mentions.empty or not required_columns.issubset(skill_mentions.columns):
+        return {}
+
+    score_column = "NLP Score" if "NLP Score" in skill_mentions.columns else "Correlation Coefficient"
+    if score_column not in skill_mentions.columns:
+        return {}
+
+    ranked = (
+        skill_mentions[["Research ID", "Taxonomy Skill", score_column]]
+        .copy()
+        .sort_values(score_column, ascending=False)
+        .drop_duplicates(subset=["Research ID", "Taxonomy Skill"])
+    )
+    return {
+        job_id: tuple(group["Taxonomy Skill"].astype(str))
+        for job_id, group in ranked.groupby(ranked["Research ID"].astype(str), sort=False)
+    }
+
+
+@functools.lru_cache(maxsize=65536)
+def _skill_tokens(skill: str) -> tuple[str, ...]:
+    """Tokens of a skill worth matching on, cached across gap queries.
+
+    The skill catalog is stable while users issue many queries, so each
+    skill string is lowered and split at most once per process.
+    """
+    return tuple(token for token in skill.lower().split() if len(token) > 3)
+
+
+def _match_flags(skills, user_text_lower: str) -> dict[str, bool]:
+    """Evaluate each unique skill once, caching per-token substring hits.
+
+    Skills share tokens heavily across a result set, so each distinct token
+    is scanned against the user text exactly once instead of N x M times.
+    """
+    token_hits: dict[str, bool] = {}
+    flags: dict[str, bool] = {}
+    for skill in skills:
+        if skill in flags:
+            continue
+        matched = False
+        for token in _skill_tokens(skill):
+            hit = token_hits.get(token)
+            if hit is None:
+                hit = token in user_text_lower
+                token_hits[token] = hit
+            if hit:
+                matched = True
+                break
+        flags[skill] = matched
+    return flags
+
+
+def _split_matched_missing(skills: list[str], user_text_lower: str) -> tuple[list[str], list[str]]:
+    flags = _match_flags(skills, user_text_lower)
+    matched_skills = [skill for skill in skills if flags[skill]]
+    missing_skills = [skill for skill in skills if not flags[skill]]
+    return matched_skills, missing_skills
+
+
+def compute_skill_gaps(
+    user_text: str,
+    job_ids: list[str],
+    skill_mentions: pd.DataFrame,
+    limit: int = 12,
+    skill_rankings: dict[str, tuple[str, ...]] | None = None,
+) -> dict[str, tuple[list[str], list[str]]]:
+    """Batched compute_skill_gap: one pass over the mentions for a whole result set."""
+    gaps: dict[str, tuple[list[str], list[str]]] = {str(job_id): ([], []) for job_id in job_ids}
+    if not gaps:
+        return gaps
+
+    if skill_rankings is not None:
+        user_text_lower = str(user_text).lower()
+        for job_id in gaps:
+            skills = list(skill_rankings.get(job_id, ())[:limit])
+            if skills:
+                gaps[job_id] = _split_matched_missing(skills, user_text_lower)
+        return gaps
+
+    if skill_mentions.empty:
+        return gaps
+
+    required_columns = {"Research ID", "Taxonomy Skill"}
+    if not required_columns.issubset(skill_mentions.columns):
+        return gaps
+
+    score_column = "NLP Score" if "NLP Score" in skill_mentions.columns else "Correlation Coefficient"
+    if score_column not in skill_mentions.columns:
+        return gaps
+
+    mention_ids = skill_mentions["Research ID"].astype(str)
+    relevant = skill_mentions[mention_ids.isin(gaps.keys())]
+    if relevant.empty:
+        return gaps
+
+    ranked = (
+        relevant[["Research ID", "Taxonomy Skill", score_column]]
+        .copy()
+        .sort_values(score_column, ascending=False)
+        .drop_duplicates(subset=["Research ID", "Taxonomy Skill"])
+    )
+
+    # Factorize the skill strings so each unique skill is tokenized and
+    # checked against the user text exactly once per batch; per-job results
+    # then reduce to indexing into the precomputed match flags.
+    user_text_lower = str(user_text).lower()
+    codes, unique_skills = pd.factorize(ranked["Taxonomy Skill"].astype(str))
+    unique_matched = np.empty(len(unique_skills), dtype=bool)
+    for position, skill in enumerate(unique_skills):
+        token_candidates = _skill_tokens(skill)
+        unique_matched[position] = bool(token_candidates) and any(
+            token in user_text_lower for token in token_candidates
+        )
+    ranked = ranked.assign(skill_matched=unique_matched[codes])
+
+    for job_id, group in ranked.groupby(ranked["Research ID"].astype(str), sort=False):
+        top = group.head(limit)
+        skills = top["Taxonomy Skill"].astype(str).tolist()
+        flags = top["skill_matched"].tolist()
+        gaps[job_id] = (
+            [skill for skill, flag in zip(skills, flags) if flag],
+            [skill for skill, flag in zip(skills, flags) if not flag],
+        )
+
+    return gaps
+
+
 def compute_skill_gap(
     user_text: str,
     job_id: str,
@@ -72,16 +341,6 @@ def compute_skill_gap(
         .head(limit)
     )
 
-    user_text_lower = str(user_text).lower()
-    matched_skills: list[str] = []
-    missing_skills: list[str] = []
-
-    for skill in ranked["Taxonomy Skill"].astype(str).tolist():
-        token_candidates = [token for token in skill.lower().split() if len(token) > 3]
-        has_match = token_candidates and any(token in user_text_lower for token in token_candidates)
-        if has_match:
-            matched_skills.append(skill)
-        else:
-            missing_skills.append(skill)
-
-    return matched_skills, missing_skills
+    return _split_matched_missing(
+        ranked["Taxonomy Skill"].astype(str).tolist(), str(user_text).lower()
+    )
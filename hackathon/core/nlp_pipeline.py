@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import re
+import string
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 TEXT_COLUMNS = [
     "title",
@@ -17,9 +23,19 @@ TEXT_COLUMNS = [
 ]
 
 
+# Single-C-call replacement for the old [^a-zA-Z0-9\s] regex pass: every
+# byte-range character that is not lowercase alnum or a space maps to space.
+_KEEP_CHARS = frozenset(string.ascii_lowercase + string.digits + " ")
+_NORMALIZE_TABLE = {
+    codepoint: (chr(codepoint) if chr(codepoint) in _KEEP_CHARS else " ")
+    for codepoint in range(256)
+}
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _normalize_text(value: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9\s]", " ", str(value).lower())
-    return re.sub(r"\s+", " ", cleaned).strip()
+    collapsed = str(value).lower().translate(_NORMALIZE_TABLE)
+    return _WHITESPACE_RE.sub(" ", collapsed).strip()
 
 
 def build_job_text_corpus(jobs_clean: pd.DataFrame) -> pd.Series:
@@ -27,8 +43,19 @@ def build_job_text_corpus(jobs_clean: pd.DataFrame) -> pd.Series:
     if not available_cols:
         return pd.Series([""] * len(jobs_clean), index=jobs_clean.index)
 
-    corpus = jobs_clean[available_cols].fillna("").astype(str).agg(" ".join, axis=1)
-    return corpus.map(_normalize_text)
+    corpus = jobs_clean[available_cols[0]].fillna("").astype(str)
+    if len(available_cols) > 1:
+        corpus = corpus.str.cat(
+            [jobs_clean[column].fillna("").astype(str) for column in available_cols[1:]],
+            sep=" ",
+        )
+    # Vectorized twin of _normalize_text: same regexes, C string kernels.
+    return (
+        corpus.str.lower()
+        .str.replace(r"[^a-z0-9\s]", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
 
 
 def build_skill_catalog(
@@ -58,6 +85,46 @@ def _iter_batches(total_size: int, batch_size: int) -> Iterable[tuple[int, int]]
         yield start, min(start + batch_size, total_size)
 
 
+def _select_batch_mentions(data, columns, indptr, n_rows, min_similarity, top_k):
+    """Threshold + per-row top-k over raw CSR buffers for one batch.
+
+    Kept numba-njit compatible (plain loops, slicing, argsort) so the
+    optional JIT below can compile it unchanged.
+    """
+    max_out = n_rows * top_k
+    out_row = np.empty(max_out, np.int64)
+    out_col = np.empty(max_out, np.int64)
+    out_score = np.empty(max_out, np.float32)
+    position = 0
+    for row in range(n_rows):
+        low = indptr[row]
+        high = indptr[row + 1]
+        if low == high:
+            continue
+
+        scores = data[low:high]
+        indices = columns[low:high]
+        keep_mask = scores >= min_similarity
+        scores = scores[keep_mask]
+        indices = indices[keep_mask]
+        if scores.size == 0:
+            continue
+
+        order = np.argsort(-scores)
+        if order.size > top_k:
+            order = order[:top_k]
+        for rank in order:
+            out_row[position] = row
+            out_col[position] = indices[rank]
+            out_score[position] = scores[rank]
+            position += 1
+    return out_row[:position], out_col[:position], out_score[:position]
+
+
+if numba is not None:
+    _select_batch_mentions = numba.njit(cache=True)(_select_batch_mentions)
+
+
 def extract_skill_mentions_from_text(
     jobs_clean: pd.DataFrame,
     processed: pd.DataFrame,
@@ -81,52 +148,56 @@ def extract_skill_mentions_from_text(
         min_df=2,
         max_df=0.95,
         sublinear_tf=True,
+        dtype=np.float32,
     )
     tfidf_matrix = vectorizer.fit_transform(combined_texts)
 
     job_count = len(jobs_clean)
     job_matrix = tfidf_matrix[:job_count]
-    skill_matrix = tfidf_matrix[job_count:]
+    # Transpose once up front; .T per batch would rebuild the CSC view (and
+    # the float32 dtype halves the bandwidth of the sparse products below).
+    skill_matrix_t = tfidf_matrix[job_count:].T.tocsr()
 
     skill_labels = np.array(skill_catalog)
-    job_ids = jobs_clean["system_job_id"].astype(str).tolist()
-    records: list[tuple[str, str, float]] = []
-
-    for start, end in _iter_batches(job_count, batch_size):
-        batch_similarity = (job_matrix[start:end] @ skill_matrix.T).tocsr()
-
-        for local_row in range(batch_similarity.shape[0]):
-            row = batch_similarity.getrow(local_row)
-            if row.nnz == 0:
-                continue
+    job_ids = jobs_clean["system_job_id"].astype(str).to_numpy(dtype=object)
 
-            scores = row.data
-            indices = row.indices
+    # Struct-of-arrays output: three preallocated columns filled by slice
+    # assignment, instead of millions of (id, skill, score) tuples for the
+    # DataFrame constructor to unpack. float32 halves the score memory.
+    max_rows = job_count * top_k
+    out_job = np.empty(max_rows, dtype=object)
+    out_skill = np.empty(max_rows, dtype=object)
+    out_score = np.empty(max_rows, dtype=np.float32)
+    cursor = 0
 
-            keep_mask = scores >= min_similarity
-            if not np.any(keep_mask):
-                continue
-
-            scores = scores[keep_mask]
-            indices = indices[keep_mask]
-
-            if len(scores) > top_k:
-                top_idx = np.argpartition(-scores, top_k - 1)[:top_k]
-                scores = scores[top_idx]
-                indices = indices[top_idx]
-
-            order = np.argsort(-scores)
-            for score, skill_idx in zip(scores[order], indices[order]):
-                records.append(
-                    (
-                        job_ids[start + local_row],
-                        str(skill_labels[skill_idx]),
-                        float(score),
-                    )
-                )
-
-    mentions = pd.DataFrame(records, columns=["Research ID", "Taxonomy Skill", "NLP Score"])
-    return mentions
+    for start, end in _iter_batches(job_count, batch_size):
+        batch_similarity = (job_matrix[start:end] @ skill_matrix_t).tocsr()
+        # Slice the CSR buffers through indptr directly; getrow() would build
+        # a fresh one-row sparse matrix object per job. The selection kernel
+        # runs under numba when it is installed.
+        selected_rows, selected_cols, selected_scores = _select_batch_mentions(
+            batch_similarity.data,
+            batch_similarity.indices.astype(np.int64),
+            batch_similarity.indptr.astype(np.int64),
+            end - start,
+            min_similarity,
+            top_k,
+        )
+        count = selected_scores.size
+        if count == 0:
+            continue
+        out_job[cursor : cursor + count] = job_ids[start + selected_rows]
+        out_skill[cursor : cursor + count] = skill_labels[selected_cols]
+        out_score[cursor : cursor + count] = selected_scores
+        cursor += count
+
+    return pd.DataFrame(
+        {
+            "Research ID": out_job[:cursor],
+            "Taxonomy Skill": out_skill[:cursor],
+            "NLP Score": out_score[:cursor],
+        }
+    )
 
 
 def build_skill_profiles_from_mentions(mentions: pd.DataFrame) -> pd.DataFrame:
@@ -136,9 +207,16 @@ def build_skill_profiles_from_mentions(mentions: pd.DataFrame) -> pd.DataFrame:
     ordered = mentions.sort_values(["Research ID", "NLP Score"], ascending=[True, False])
     deduped = ordered.drop_duplicates(subset=["Research ID", "Taxonomy Skill"])
 
+    # Categorical key hashes int codes in the groupby; the bare " ".join agg
+    # takes pandas' fast path instead of a per-group Python lambda.
+    deduped = deduped.assign(**{
+        "Research ID": deduped["Research ID"].astype("category"),
+        "Taxonomy Skill": deduped["Taxonomy Skill"].astype(str),
+    })
+
     skill_profiles = (
-        deduped.groupby("Research ID", as_index=False)["Taxonomy Skill"]
-        .agg(lambda values: " ".join(values.astype(str)))
+        deduped.groupby("Research ID", as_index=False, observed=True)["Taxonomy Skill"]
+        .agg(" ".join)
         .rename(
             columns={
                 "Research ID": "system_job_id",
@@ -150,13 +228,15 @@ def build_skill_profiles_from_mentions(mentions: pd.DataFrame) -> pd.DataFrame:
     return skill_profiles
 
 
+# Non-capturing groups: these patterns only feed str.contains, and capturing
+# groups there trigger pandas' match-group UserWarning on every run.
 EDUCATION_PATTERNS: list[tuple[re.Pattern, str]] = [
-    (re.compile(r"\b(ph\.?d|doctorate|doctoral)\b", re.IGNORECASE), "Doctorate"),
-    (re.compile(r"\b(master'?s|mba|m\.s\.|m\s?s\b|m\.a\.|m\s?a\b)\b", re.IGNORECASE), "Master's Degree"),
-    (re.compile(r"\b(bachelor'?s|b\.s\.|b\s?s\b|b\.a\.|b\s?a\b|undergraduate degree)\b", re.IGNORECASE), "Bachelor's Degree"),
+    (re.compile(r"\b(?:ph\.?d|doctorate|doctoral)\b", re.IGNORECASE), "Doctorate"),
+    (re.compile(r"\b(?:master'?s|mba|m\.s\.|m\s?s\b|m\.a\.|m\s?a\b)\b", re.IGNORECASE), "Master's Degree"),
+    (re.compile(r"\b(?:bachelor'?s|b\.s\.|b\s?s\b|b\.a\.|b\s?a\b|undergraduate degree)\b", re.IGNORECASE), "Bachelor's Degree"),
     (re.compile(r"\bassociate'?s\b", re.IGNORECASE), "Associate Degree"),
-    (re.compile(r"\b(high school|ged|secondary school)\b", re.IGNORECASE), "High School Diploma/GED"),
-    (re.compile(r"\b(certification|certificate)\b", re.IGNORECASE), "Certification"),
+    (re.compile(r"\b(?:high school|ged|secondary school)\b", re.IGNORECASE), "High School Diploma/GED"),
+    (re.compile(r"\b(?:certification|certificate)\b", re.IGNORECASE), "Certification"),
 ]
 
 EXPERIENCE_PATTERNS: list[re.Pattern] = [
@@ -167,82 +247,74 @@ EXPERIENCE_PATTERNS: list[re.Pattern] = [
 ]
 
 ENTRY_LEVEL_PATTERN = re.compile(
-    r"\b(entry level|no experience|0\s*years?|fresh graduate|new grad)\b",
+    r"\b(?:entry level|no experience|0\s*years?|fresh graduate|new grad)\b",
     re.IGNORECASE,
 )
 
 
-def _normalize_existing_requirement(value: str) -> str:
-    text = str(value).strip()
-    if not text or text.lower() in {"nan", "none", "null"}:
-        return ""
-    return text
+def _normalize_requirement_column(series: pd.Series) -> pd.Series:
+    text = series.fillna("").astype(str).str.strip()
+    return text.mask(text.str.lower().isin({"nan", "none", "null"}), "")
 
 
-def _infer_education_from_text(text: str) -> str:
+def infer_education_and_experience(jobs_clean: pd.DataFrame) -> pd.DataFrame:
+    def _column(name: str) -> pd.Series:
+        if name in jobs_clean.columns:
+            return jobs_clean[name].fillna("").astype(str)
+        return pd.Series("", index=jobs_clean.index, dtype=object)
+
+    source_text = _column("title").str.cat(_column("description"), sep=" ")
+    raw_education = _normalize_requirement_column(_column("requirements_min_education"))
+    raw_experience = _normalize_requirement_column(_column("requirements_experience"))
+
+    # Each pattern is one vectorized contains() pass over rows still unlabeled;
+    # the pattern order encodes precedence, same as the old per-row scan.
+    inferred_education = pd.Series("", index=jobs_clean.index, dtype=object)
     for pattern, label in EDUCATION_PATTERNS:
-        if pattern.search(text):
-            return label
-    return ""
-
-
-def _infer_experience_from_text(text: str) -> str:
-    if ENTRY_LEVEL_PATTERN.search(text):
-        return "Entry level / no experience"
-
-    for pattern in EXPERIENCE_PATTERNS:
-        match = pattern.search(text)
-        if not match:
-            continue
-
-        minimum = match.group(1)
-        maximum = match.group(2)
-        unit = match.group(3).lower()
-        normalized_unit = "years" if "year" in unit or "yr" in unit else "months"
-
-        if maximum:
-            return f"{minimum}-{maximum} {normalized_unit}"
-        return f"{minimum} {normalized_unit}"
-
-    return ""
-
+        mask = inferred_education.eq("") & source_text.str.contains(pattern, na=False)
+        inferred_education = inferred_education.mask(mask, label)
+
+    entry_level = source_text.str.contains(ENTRY_LEVEL_PATTERN, na=False)
+    extracted = source_text.str.extract(EXPERIENCE_PATTERNS[0])
+    minimum = extracted[0].fillna("")
+    maximum = extracted[1].fillna("")
+    unit = extracted[2].fillna("").str.lower()
+    normalized_unit = np.where(
+        unit.str.contains("year") | unit.str.contains("yr"), "years", "months"
+    )
+    from_pattern = np.where(
+        minimum.ne(""),
+        np.where(
+            maximum.ne(""),
+            minimum + "-" + maximum + " " + normalized_unit,
+            minimum + " " + normalized_unit,
+        ),
+        "",
+    )
+    inferred_experience = pd.Series(
+        np.where(entry_level, "Entry level / no experience", from_pattern),
+        index=jobs_clean.index,
+    )
 
-def infer_education_and_experience(jobs_clean: pd.DataFrame) -> pd.DataFrame:
-    required_columns = [
-        "system_job_id",
-        "title",
-        "description",
-        "requirements_min_education",
-        "requirements_experience",
-    ]
-    working = jobs_clean.copy()
-    for column in required_columns:
-        if column not in working.columns:
-            working[column] = ""
-
-    rows: list[dict[str, str]] = []
-    for _, row in working.iterrows():
-        title = str(row.get("title", ""))
-        description = str(row.get("description", ""))
-        raw_education = _normalize_existing_requirement(row.get("requirements_min_education", ""))
-        raw_experience = _normalize_existing_requirement(row.get("requirements_experience", ""))
-
-        source_text = f"{title} {description}"
-
-        inferred_education = raw_education or _infer_education_from_text(source_text)
-        inferred_experience = raw_experience or _infer_experience_from_text(source_text)
-
-        education_source = "dataset" if raw_education else ("nlp_inferred" if inferred_education else "not_specified")
-        experience_source = "dataset" if raw_experience else ("nlp_inferred" if inferred_experience else "not_specified")
-
-        rows.append(
-            {
-                "system_job_id": str(row.get("system_job_id", "")),
-                "education_display": inferred_education,
-                "education_source": education_source,
-                "experience_display": inferred_experience,
-                "experience_source": experience_source,
-            }
-        )
+    education_display = raw_education.where(raw_education.ne(""), inferred_education)
+    experience_display = raw_experience.where(raw_experience.ne(""), inferred_experience)
+    education_source = np.where(
+        raw_education.ne(""),
+        "dataset",
+        np.where(inferred_education.ne(""), "nlp_inferred", "not_specified"),
+    )
+    experience_source = np.where(
+        raw_experience.ne(""),
+        "dataset",
+        np.where(inferred_experience.ne(""), "nlp_inferred", "not_specified"),
+    )
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(
+        {
+            "system_job_id": _column("system_job_id"),
+            "education_display": education_display,
+            "education_source": education_source,
+            "experience_display": experience_display,
+            "experience_source": experience_source,
+        }
+    ).reset_index(drop=True)
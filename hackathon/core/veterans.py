@@ -1,11 +1,17 @@
 import re
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 from hackathon.core.matching import find_matching_jobs
 
 
-MOC_DICTIONARY = {
+# Read-only: the app iterates this mapping at import time and nothing may
+# mutate the code -> (title, skill query) pairs afterwards.
+MOC_DICTIONARY = MappingProxyType({
     "11B": ("Infantry Soldier", "leadership team management operations security patrol coordination"),
     "68W": ("Combat Medic", "patient care emergency medical first aid healthcare nursing triage clinical"),
     "25U": (
@@ -32,17 +38,124 @@ MOC_DICTIONARY = {
     "13F": ("Fire Support Specialist", "coordination communications analysis operations planning"),
     "19D": ("Cavalry Scout", "reconnaissance operations security intelligence coordination surveillance"),
     "12Y": ("Geospatial Engineer", "GIS mapping data analysis geospatial systems spatial engineering"),
-}
+})
+
+
+# Uppercasing moc_codes is O(rows) and the column never changes between data
+# reloads, so the normalized Series is cached per frame (same id+len keying as
+# the matching-index cache).
+_MOC_UPPER_CACHE: dict[int, pd.Series] = {}
+_MOC_UPPER_CACHE_MAX = 2
+
+
+def _moc_codes_upper(jobs_clean: pd.DataFrame) -> pd.Series:
+    key = id(jobs_clean)
+    cached = _MOC_UPPER_CACHE.get(key)
+    if cached is None or len(cached) != len(jobs_clean):
+        # Ingestion forces moc_codes to string dtype (and fills NA with ""),
+        # so upper-casing runs on the string kernel with no astype guard.
+        cached = jobs_clean["moc_codes"].str.upper()
+        if len(_MOC_UPPER_CACHE) >= _MOC_UPPER_CACHE_MAX:
+            _MOC_UPPER_CACHE.pop(next(iter(_MOC_UPPER_CACHE)))
+        _MOC_UPPER_CACHE[key] = cached
+    return cached
+
+
+# Inverted index over the tokenized moc_codes column: each code maps straight
+# to its row positions, so a lookup is a dict hit plus one iloc gather instead
+# of a substring scan over every row.
+_MOC_INDEX_CACHE: dict[int, tuple[int, dict[str, np.ndarray]]] = {}
+_MOC_INDEX_CACHE_MAX = 2
+
+# Cells are array-repr strings like "['001372' '4N111']"; splitting on every
+# non-alphanumeric run strips the quotes and brackets from the codes.
+_MOC_SPLIT_RE = re.compile(r"[^A-Z0-9]+")
+
+# Empty-input and unknown-code rejects are common from the UI; one shared
+# zero-row frame per jobs frame avoids rebuilding the O(cols) skeleton each
+# time. Safe to share because copy-on-write guards against caller mutation.
+_EMPTY_FRAME_CACHE: dict[int, pd.DataFrame] = {}
+_EMPTY_FRAME_CACHE_MAX = 2
+
+
+def _empty_matches(jobs_clean: pd.DataFrame) -> pd.DataFrame:
+    key = id(jobs_clean)
+    cached = _EMPTY_FRAME_CACHE.get(key)
+    if cached is None:
+        if len(_EMPTY_FRAME_CACHE) >= _EMPTY_FRAME_CACHE_MAX:
+            _EMPTY_FRAME_CACHE.pop(next(iter(_EMPTY_FRAME_CACHE)))
+        cached = jobs_clean.head(0)
+        _EMPTY_FRAME_CACHE[key] = cached
+    return cached
+
+
+def _moc_code_index(jobs_clean: pd.DataFrame) -> dict[str, np.ndarray]:
+    key = id(jobs_clean)
+    cached = _MOC_INDEX_CACHE.get(key)
+    if cached is None or cached[0] != len(jobs_clean):
+        positions: dict[str, list[int]] = defaultdict(list)
+        column = jobs_clean["moc_codes"]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # The dictionary encoding means string work only needs to run per
+            # distinct value: tokenize each category once, then walk the
+            # integer codes for the per-row positions.
+            category_tokens = [
+                [token for token in _MOC_SPLIT_RE.split(str(value).upper()) if token]
+                for value in column.cat.categories
+            ]
+            for position, code in enumerate(column.cat.codes.to_numpy()):
+                if code >= 0:
+                    for token in category_tokens[code]:
+                        positions[token].append(position)
+        else:
+            for position, tokens in enumerate(_moc_codes_upper(jobs_clean).str.split(_MOC_SPLIT_RE)):
+                for token in tokens:
+                    if token:
+                        positions[token].append(position)
+        index = {code: np.asarray(rows, dtype=np.int64) for code, rows in positions.items()}
+        if len(_MOC_INDEX_CACHE) >= _MOC_INDEX_CACHE_MAX:
+            _MOC_INDEX_CACHE.pop(next(iter(_MOC_INDEX_CACHE)))
+        _MOC_INDEX_CACHE[key] = (len(jobs_clean), index)
+        return index
+    return cached[1]
+
+
+def find_direct_moc_matches_many(moc_codes: Iterable[str], jobs_clean: pd.DataFrame) -> pd.DataFrame:
+    """Union the direct matches for several MOC codes in one gather.
+
+    Related codes (e.g. 11B/11C/11Z) resolve through the inverted index and
+    a single deduplicated iloc instead of one full lookup per code.
+    """
+    index = _moc_code_index(jobs_clean)
+    row_arrays = [
+        rows
+        for rows in (index.get(str(code).upper().strip()) for code in moc_codes)
+        if rows is not None and rows.size
+    ]
+    if not row_arrays:
+        return _empty_matches(jobs_clean)
+
+    # iloc with a position array already materializes new column buffers, so
+    # no defensive copy is needed on top.
+    union = np.unique(np.concatenate(row_arrays))
+    return jobs_clean.iloc[union]
 
 
 def find_direct_moc_matches(moc_code: str, jobs_clean: pd.DataFrame) -> pd.DataFrame:
-    code = moc_code.upper().strip()
-    if not code:
-        return jobs_clean.head(0).copy()
+    return find_direct_moc_matches_many((moc_code,), jobs_clean)
+
+
+# Repeated submissions of the same MOC re-run the whole TF-IDF search; the
+# memo keys on the input frames by identity so a data reload naturally starts
+# a fresh cache generation.
+_FULL_MATCH_CACHE: dict[tuple, tuple[pd.DataFrame, pd.DataFrame, str]] = {}
+_FULL_MATCH_CACHE_MAX = 256
 
-    pattern = re.escape(code)
-    matches = jobs_clean[jobs_clean["moc_codes"].astype(str).str.upper().str.contains(pattern, na=False, regex=True)]
-    return matches.copy()
+# Distinct MOC codes can resolve to the same skill query (every unrecognized
+# code shares the generic fallback), so the expensive skill search is also
+# memoized one level down, on the resolved query text.
+_SKILL_QUERY_CACHE: dict[tuple, pd.DataFrame] = {}
+_SKILL_QUERY_CACHE_MAX = 64
 
 
 def veteran_full_match(
@@ -51,8 +164,17 @@ def veteran_full_match(
     skill_profiles: pd.DataFrame,
     top_n: int = 8,
     matching_index: tuple | None = None,
+    jobs_indexed: pd.DataFrame | None = None,
+    skill_fallback_threshold: int | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, str]:
     code = moc_code.upper().strip()
+    if skill_fallback_threshold is None:
+        skill_fallback_threshold = top_n
+
+    cache_key = (code, top_n, skill_fallback_threshold, id(jobs_clean), id(skill_profiles))
+    cached = _FULL_MATCH_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     direct_matches = find_direct_moc_matches(code, jobs_clean)
 
@@ -61,12 +183,32 @@ def veteran_full_match(
     else:
         title, skill_query = code, "operations leadership management"
 
-    skill_matches = find_matching_jobs(
-        user_input=skill_query,
-        jobs_clean=jobs_clean,
-        skill_profiles=skill_profiles,
-        top_n=top_n,
-        matching_index=matching_index,
-    )
+    if len(direct_matches) >= skill_fallback_threshold:
+        # Enough directly tagged postings already; skip the vector search and
+        # hand back an empty skill frame with the usual columns.
+        result = (direct_matches, _empty_matches(jobs_clean), title)
+        if len(_FULL_MATCH_CACHE) >= _FULL_MATCH_CACHE_MAX:
+            _FULL_MATCH_CACHE.pop(next(iter(_FULL_MATCH_CACHE)))
+        _FULL_MATCH_CACHE[cache_key] = result
+        return result
+
+    query_key = (skill_query, top_n, id(jobs_clean), id(skill_profiles))
+    skill_matches = _SKILL_QUERY_CACHE.get(query_key)
+    if skill_matches is None:
+        skill_matches = find_matching_jobs(
+            user_input=skill_query,
+            jobs_clean=jobs_clean,
+            skill_profiles=skill_profiles,
+            top_n=top_n,
+            matching_index=matching_index,
+            jobs_indexed=jobs_indexed,
+        )
+        if len(_SKILL_QUERY_CACHE) >= _SKILL_QUERY_CACHE_MAX:
+            _SKILL_QUERY_CACHE.pop(next(iter(_SKILL_QUERY_CACHE)))
+        _SKILL_QUERY_CACHE[query_key] = skill_matches
 
-    return direct_matches, skill_matches, title
+    result = (direct_matches, skill_matches, title)
+    if len(_FULL_MATCH_CACHE) >= _FULL_MATCH_CACHE_MAX:
+        _FULL_MATCH_CACHE.pop(next(iter(_FULL_MATCH_CACHE)))
+    _FULL_MATCH_CACHE[cache_key] = result
+    return result
@@ -2,8 +2,14 @@ from hackathon.core.data import prepare_nlp_artifacts, prepare_raw_data
 
 
 if __name__ == "__main__":
-    jobs_file, processed_file = prepare_raw_data()
+    # prepare_nlp_artifacts drives the whole pipeline: it loads (and, when
+    # needed, extracts) the raw data itself, so running prepare_raw_data
+    # first just did the extraction pass twice. The stages stay serial on
+    # purpose — every artifact derives from the previous stage's output, and
+    # the expensive steps already fan out internally (joblib workers for the
+    # requirements profile, threaded TF-IDF for the mentions).
     mentions_file, profiles_file, requirements_file = prepare_nlp_artifacts()
+    jobs_file, processed_file = prepare_raw_data()
     print(f"Prepared: {jobs_file}")
     print(f"Prepared: {processed_file}")
     print(f"Built NLP mentions: {mentions_file}")
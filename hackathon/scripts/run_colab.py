@@ -1,5 +1,18 @@
+import socket
 import subprocess
 import sys
+import time
+
+STREAMLIT_PORT = 8501
+
+
+def _wait_for_server(port: int, attempts: int = 50) -> None:
+    for _ in range(attempts):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
 
 
 def main() -> None:
@@ -10,9 +23,22 @@ def main() -> None:
             "Install pyngrok first: pip install pyngrok"
         ) from exc
 
-    subprocess.Popen([sys.executable, "-m", "streamlit", "run", "hackathon/app.py"])
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "streamlit",
+            "run",
+            "hackathon/app.py",
+            "--server.headless=true",
+            "--server.fileWatcherType=none",
+        ]
+    )
+    # Open the tunnel only once Streamlit is actually bound, otherwise the
+    # first request through ngrok 502s until the server finishes starting.
+    _wait_for_server(STREAMLIT_PORT)
     ngrok.kill()
-    public_url = ngrok.connect(8501)
+    public_url = ngrok.connect(STREAMLIT_PORT, bind_tls=True)
     print(f"LIVE APP: {public_url}")
 
 
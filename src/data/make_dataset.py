@@ -1,23 +1,60 @@
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import feather
 
 
 def load_raw_dataset(input_path: Path) -> pd.DataFrame:
-    return pd.read_csv(input_path)
+    # Arrow's multi-threaded CSV parser skips pandas' inference pass and
+    # dictionary-encodes low-cardinality string columns during the read, so
+    # no separate category-conversion sweep is needed afterwards. There is no
+    # fixed schema to declare for this scaffold — newlines_in_values covers
+    # the quoted multiline text fields, and anything Arrow still rejects
+    # falls back to pandas' forgiving parser.
+    try:
+        table = pa_csv.read_csv(
+            input_path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(auto_dict_encode=True),
+        )
+    except pa.ArrowInvalid:
+        return pd.read_csv(input_path)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
 
-def save_processed_dataset(df: pd.DataFrame, output_path: Path) -> None:
+def save_processed_dataset(df: pd.DataFrame, output_path: Path, csv_copy: bool = False) -> Path:
+    """Write the processed dataset as Feather v2; optionally keep a CSV copy.
+
+    Feather keeps the dtypes (including category), reads back without type
+    inference, and memory-maps on load; the CSV copy is only for human
+    inspection.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    feather_path = output_path.with_suffix(".feather")
+    df.reset_index(drop=True).to_feather(feather_path, compression="zstd", compression_level=3)
+    if csv_copy:
+        df.to_csv(output_path.with_suffix(".csv"), index=False)
+    return feather_path
+
+
+def load_processed_dataset(input_path: Path) -> pd.DataFrame:
+    # pyarrow's reader exposes memory_map (pandas' wrapper does not), so cold
+    # loads page in Arrow buffers instead of copying the whole file.
+    # read_table + to_pandas sidesteps the stored pandas dtype metadata,
+    # which cannot reconstruct the dictionary-encoded ArrowDtype columns the
+    # raw loader produces; dictionary columns come back as category.
+    table = feather.read_table(input_path.with_suffix(".feather"), memory_map=True)
+    return table.to_pandas()
 
 
 if __name__ == "__main__":
     raw_path = Path("data/raw/dataset.csv")
-    processed_path = Path("data/processed/dataset_processed.csv")
+    processed_path = Path("data/processed/dataset_processed.feather")
 
     if raw_path.exists():
         dataset = load_raw_dataset(raw_path)
-        save_processed_dataset(dataset, processed_path)
-        print(f"Saved processed dataset to {processed_path}")
+        saved_path = save_processed_dataset(dataset, processed_path)
+        print(f"Saved processed dataset to {saved_path}")
     else:
         print(f"No input file found at {raw_path}")
@@ -1,12 +1,35 @@
+from dataclasses import dataclass
 from pathlib import Path
+
 import joblib
-from sklearn.dummy import DummyClassifier
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class MajorityClassBaseline:
+    """Constant most-frequent-class predictor.
+
+    Does the same job as DummyClassifier(strategy="most_frequent") without
+    its per-call input validation: predict is one broadcast of the stored
+    majority class.
+    """
+
+    constant: object
+    classes_: np.ndarray
+
+    def predict(self, X) -> np.ndarray:
+        return np.broadcast_to(np.asarray(self.constant), (len(X),))
+
+    def predict_proba(self, X) -> np.ndarray:
+        row = (self.classes_ == self.constant).astype(float)
+        return np.broadcast_to(row, (len(X), row.size))
 
 
-def train_baseline_model(X, y):
-    model = DummyClassifier(strategy="most_frequent")
-    model.fit(X, y)
-    return model
+def train_baseline_model(X, y) -> MajorityClassBaseline:
+    values = pd.Series(y).dropna()
+    constant = values.mode().iloc[0]
+    return MajorityClassBaseline(constant, np.sort(values.unique()))
 
 
 def save_model(model, output_path: Path) -> None:
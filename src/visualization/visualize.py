@@ -1,11 +1,33 @@
+import threading
 from pathlib import Path
+
+import matplotlib
+
+# Headless raster backend: no GUI toolkit init, and savefig renders once.
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 
+# The sample figure is static, and building a Matplotlib artist tree is the
+# slow part; build it once and pay only for savefig per call.
+_FIG_LOCK = threading.Lock()
+_FIG = None
+
+
+def _sample_figure():
+    global _FIG
+    if _FIG is None:
+        fig, ax = plt.subplots()
+        ax.plot([1, 2, 3], [1, 4, 9])
+        ax.set_title("Sample Plot")
+        # tight_layout once at build time replaces bbox_inches="tight",
+        # which would re-render the figure twice on every save.
+        fig.tight_layout()
+        _FIG = fig
+    return _FIG
+
 
 def save_basic_plot(output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig, ax = plt.subplots()
-    ax.plot([1, 2, 3], [1, 4, 9])
-    ax.set_title("Sample Plot")
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
+    with _FIG_LOCK:
+        _sample_figure().savefig(output_path)